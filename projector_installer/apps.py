@@ -4,26 +4,27 @@
 
 
 """Application management functions."""
+import re
 import shutil
 import sys
 import os
-from os import listdir
-from os.path import join, dirname, isfile, isdir, basename, expanduser
-from distutils.version import LooseVersion
-from typing import Optional, List, Tuple
+from os.path import join, dirname, isfile, isdir, basename, expanduser, lexists
+from typing import Optional, List, Tuple, Dict, Pattern
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-import json
+from functools import lru_cache
 from xml.etree.ElementTree import Element, parse, SubElement
 
 from .global_config import get_apps_dir, get_download_cache_dir
 from .utils import unpack_tar_file, expand_path, download_file, \
-    create_dir_if_not_exist, is_linux_x86_64
+    create_dir_if_not_exist, is_linux_x86_64, json_loads, get_version_key
 
 CONFIG_PREFIX = expanduser('~/')
 VER_2020_CONFIG_PREFIX = expanduser('~/.config/JetBrains')
 ANDROID_STUDIO_CONFIG_PREFIX = expanduser('~/.config/Google')
 
 IDEA_PATH_SELECTOR = 'idea.paths.selector'
+IDEA_PATH_SELECTOR_BYTES = IDEA_PATH_SELECTOR.encode()
 IDEA_PROPERTIES_FILE = 'idea.properties'
 DISABLED_PLUGINS_FILE = 'disabled_plugins.txt'
 FORBID_UPDATE_STRING = 'ide.no.platform.update=Projector'
@@ -38,6 +39,7 @@ MPS_STARTUP_WM_CLASS = 'jetbrains-mps'
 
 NOTIFICATIONS_CONFIG = 'notifications.xml'
 UPDATES_ATTRIBUTES = {'groupId': 'Plugins updates', 'displayType': 'NONE', 'shouldLog': 'false'}
+UPDATES_NOTIFICATION_PATH = './component/notification[@groupId="Plugins updates"]'
 
 APP_NAME_FILE_EXTENSION = 'app_name'
 
@@ -53,8 +55,13 @@ def get_installed_apps(pattern: Optional[str] = None) -> List[str]:
     if not isdir(apps_dir):
         return []
 
-    res = [file_name for file_name in listdir(apps_dir) if
-           pattern is None or file_name.lower().find(pattern.lower()) != -1]
+    with os.scandir(apps_dir) as entries:
+        res = [entry.name for entry in entries]
+
+    if pattern:
+        lower_pattern = pattern.lower()
+        res = [name for name in res if lower_pattern in name.lower()]
+
     res.sort()
     return res
 
@@ -69,6 +76,12 @@ class ProductInfo:
     """Ide product info"""
 
     # pylint: disable=too-many-instance-attributes
+    # No per-instance __dict__: instances are kept in product info cache.
+    # Declared manually, since dataclass(slots=True) requires Python 3.10
+    __slots__ = ('name', 'version', 'version_suffix', 'build_number', 'product_code',
+                 'data_dir', 'svg_icon_path', 'os', 'launcher_path', 'java_exec_path',
+                 'vm_options_path', 'startup_wm_class')
+
     name: str
     version: str
     version_suffix: str
@@ -84,6 +97,7 @@ class ProductInfo:
 
 
 PRODUCT_INFO = 'product-info.json'
+PRODUCT_INFO_CACHE: Dict[str, Tuple[int, ProductInfo]] = {}
 
 
 class Version:
@@ -99,33 +113,53 @@ class VersionFormatError(Exception):
     """VersionFormatError"""
 
 
+# year[.quart[.last[.anything]]]
+VERSION_PATTERN = re.compile(r'(\d+)(?:\.(\d+)(?:\.(\d+)(?:\..*)?)?)?\Z', re.DOTALL)
+
+
+@lru_cache(maxsize=256)
 def parse_version(version: str) -> Version:
     """Parses version string to Version class."""
-    parsed = version.split(".")
+    match = VERSION_PATTERN.match(version)
 
-    try:
-        return Version(int(parsed[0]), int(parsed[1]), int(parsed[2] if len(parsed) > 2 else -1))
-    except ValueError:
+    if match is None:
         return Version(0, 0, -1)
-    except IndexError as index_error:
-        raise VersionFormatError from index_error
+
+    year, quart, last = match.groups()
+
+    if quart is None:
+        raise VersionFormatError(version)
+
+    return Version(int(year), int(quart), int(last) if last else -1)
 
 
 def get_data_dir_from_script(run_script: str) -> str:
     """Returns idea data dir from run script."""
-    with open(run_script, mode='r', encoding='utf-8') as file:
-        for line in file:
-            pos = line.find(IDEA_PATH_SELECTOR)
+    return _read_data_dir_from_script(run_script, os.stat(run_script).st_mtime_ns)
 
-            if pos != -1:
-                parts = line.split('=')
 
-                if len(parts) < 2:
-                    raise Exception(f'Unable to parse {IDEA_PATH_SELECTOR} line.')
+# mtime is a part of the cache key only: the cached entry is invalidated when file changes
+@lru_cache(maxsize=256)
+def _read_data_dir_from_script(run_script: str, mtime: int) -> str:
+    """Reads and parses run script to find idea data dir."""
+    # pylint: disable=unused-argument
+    with open(run_script, mode='rb') as file:
+        data = file.read()
 
-                return parts[1].split(' ')[0]
+    pos = data.find(IDEA_PATH_SELECTOR_BYTES)
 
-    raise Exception('Unable to find data directory in the launch script.')
+    if pos == -1:
+        raise Exception('Unable to find data directory in the launch script.')
+
+    line_start = data.rfind(b'\n', 0, pos) + 1
+    line_end = data.find(b'\n', pos)
+    line = data[line_start:line_end if line_end != -1 else len(data)].decode('utf-8')
+    parts = line.split('=')
+
+    if len(parts) < 2:
+        raise Exception(f'Unable to parse {IDEA_PATH_SELECTOR} line.')
+
+    return parts[1].split(' ')[0]
 
 
 class UnknownIDEException(Exception):
@@ -139,11 +173,20 @@ def is_mps_dir(app_path: str) -> bool:
 
 def get_mps_version(app_path: str) -> Tuple[str, str]:
     """Extract MPS version and build number from build.number file"""
-    pairs = map(lambda x: x.split('='),
-                [line.strip() for line in open(join(app_path, 'build.number'),
-                                               mode='r', encoding='utf-8')])
-    data = {elem[0]: elem[1] for elem in pairs}
-    return data['version'], data['build.number']
+    build_number_path = join(app_path, 'build.number')
+    return _read_mps_version(build_number_path, os.stat(build_number_path).st_mtime_ns)
+
+
+# mtime is a part of the cache key only: the cached entry is invalidated when file changes
+@lru_cache(maxsize=256)
+def _read_mps_version(build_number_path: str, mtime: int) -> Tuple[str, str]:
+    """Parses MPS build.number file"""
+    # pylint: disable=unused-argument
+    with open(build_number_path, mode='rb') as file:
+        pairs = [line.partition(b'=') for line in file.read().splitlines()]
+
+    data = {key.strip(): value.strip() for key, _, value in pairs}
+    return data[b'version'].decode(), data[b'build.number'].decode()
 
 
 def get_mps_product_info(app_path: str) -> ProductInfo:
@@ -165,52 +208,64 @@ def get_product_info(app_path: str) -> ProductInfo:
     prod_info_path = join(app_path, PRODUCT_INFO)
 
     try:
-        with open(prod_info_path, mode='r', encoding='utf-8') as file:
-            data = json.load(file)
-            java_exec_path = 'jre/bin/java'
-            version_suffix = ''
-
-            if 'versionSuffix' in data:
-                version_suffix = data['versionSuffix']
-
-            if 'javaExecutablePath' in data['launch'][0]:
-                java_exec_path = data['launch'][0]['javaExecutablePath']
-
-            product_info = ProductInfo(name=data['name'],
-                                       version=data['version'],
-                                       version_suffix=version_suffix,
-                                       build_number=data['buildNumber'],
-                                       product_code=data['productCode'],
-                                       data_dir='',
-                                       svg_icon_path=data['svgIconPath'],
-                                       os=data['launch'][0]['os'],
-                                       launcher_path=data['launch'][0]['launcherPath'],
-                                       java_exec_path=java_exec_path,
-                                       vm_options_path=data['launch'][0]['vmOptionsFilePath'],
-                                       startup_wm_class=data['launch'][0]['startupWmClass'])
-
-            version = parse_version(product_info.version)
-
-            if version.year >= 2020 and version.quart >= 2:
-                product_info.data_dir = data['dataDirectoryName']
-            else:
-                product_info.data_dir = get_data_dir_from_script(
-                    join(app_path, product_info.launcher_path))
+        # mtime is stored with the cached entry: the entry is replaced when file changes
+        mtime = os.stat(prod_info_path).st_mtime_ns
+        cached = PRODUCT_INFO_CACHE.get(app_path)
+
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, read_product_info(app_path))
+            PRODUCT_INFO_CACHE[app_path] = cached
+
+        return cached[1]
     except FileNotFoundError:  # MPS does not have product_info
-        product_info = get_mps_product_info(app_path)
+        return get_mps_product_info(app_path)
+
+
+def read_product_info(app_path: str) -> ProductInfo:
+    """Reads and parses product info file for given app path"""
+    with open(join(app_path, PRODUCT_INFO), mode='rb') as file:
+        data = json_loads(file.read())
+
+    java_exec_path = 'jre/bin/java'
+    version_suffix = ''
+
+    if 'versionSuffix' in data:
+        version_suffix = data['versionSuffix']
+
+    if 'javaExecutablePath' in data['launch'][0]:
+        java_exec_path = data['launch'][0]['javaExecutablePath']
+
+    product_info = ProductInfo(name=data['name'],
+                               version=data['version'],
+                               version_suffix=version_suffix,
+                               build_number=data['buildNumber'],
+                               product_code=data['productCode'],
+                               data_dir='',
+                               svg_icon_path=data['svgIconPath'],
+                               os=data['launch'][0]['os'],
+                               launcher_path=data['launch'][0]['launcherPath'],
+                               java_exec_path=java_exec_path,
+                               vm_options_path=data['launch'][0]['vmOptionsFilePath'],
+                               startup_wm_class=data['launch'][0]['startupWmClass'])
+
+    if 'dataDirectoryName' in data:
+        product_info.data_dir = data['dataDirectoryName']
+    else:  # older IDEs have data dir only in the launch script
+        product_info.data_dir = get_data_dir_from_script(
+            join(app_path, product_info.launcher_path))
 
     return product_info
 
 
-def get_launch_script(app_path: str) -> str:
+def get_launch_script(app_path: str, product_info: Optional[ProductInfo] = None) -> str:
     """Returns full path to launch script by ide path."""
-    prod_info = get_product_info(app_path)
+    prod_info = product_info or get_product_info(app_path)
     return join(app_path, prod_info.launcher_path)
 
 
-def get_bin_dir(app_path: str) -> str:
+def get_bin_dir(app_path: str, product_info: Optional[ProductInfo] = None) -> str:
     """Get full path to ide bin dir."""
-    run_script = get_launch_script(app_path)
+    run_script = get_launch_script(app_path, product_info)
     return dirname(run_script)
 
 
@@ -224,10 +279,16 @@ def is_mps(product_info: ProductInfo) -> bool:
     return product_info.product_code == 'MPS'
 
 
+@lru_cache(maxsize=1)
+def get_system_java_path() -> Optional[str]:
+    """Returns full path to java found in PATH"""
+    return shutil.which('java')
+
+
 def get_java_path(app_path: str) -> str:
     """Returns full path to bundled or system java."""
     if not is_linux_x86_64():
-        java_path = shutil.which('java')
+        java_path = get_system_java_path()
 
         if not java_path:
             print('No java found in system, please install openjdk 11. Exiting ...')
@@ -247,7 +308,7 @@ def get_app_name_cache_file(file_path: str) -> str:
 def is_installed(file_path: str) -> bool:
     """Checks if file with app_name is already exist"""
     cache_file_path = get_app_name_cache_file(file_path)
-    return isfile(cache_file_path)
+    return lexists(cache_file_path)
 
 
 def get_app_name_for(file_path: str) -> str:
@@ -261,21 +322,26 @@ def save_app_name_for(file_path: str, app_name: str) -> None:
     with open(get_app_name_cache_file(file_path), mode='w', encoding='utf-8') as file:
         file.write(app_name)
 
+    get_app_name_index.cache_clear()
+
 
-def is_matched_app_name_file(file_path: str, app_name: str) -> bool:
-    """Returns True if given file is app name file, corresponding to the given app_name"""
-    if file_path.endswith(APP_NAME_FILE_EXTENSION):
-        with open(file_path, mode='r', encoding='utf-8') as file:
-            return file.read() == app_name
+@lru_cache(maxsize=1)
+def get_app_name_index(cache_dir: str) -> Dict[str, List[str]]:
+    """Returns mapping from app name to the list of app name files in given cache dir"""
+    res: Dict[str, List[str]] = {}
 
-    return False
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(APP_NAME_FILE_EXTENSION):
+                with open(entry.path, mode='r', encoding='utf-8') as file:
+                    res.setdefault(file.read(), []).append(entry.path)
+
+    return res
 
 
 def get_app_name_files_for_app(app_name: str) -> List[str]:
     """Returns list of app name files with given app_name"""
-    cache_dir = get_download_cache_dir()
-    return [join(cache_dir, file) for file in listdir(cache_dir) if
-            is_matched_app_name_file(join(cache_dir, file), app_name)]
+    return list(get_app_name_index(get_download_cache_dir()).get(app_name, []))
 
 
 def remove_app_name_files(app_name: str) -> None:
@@ -283,15 +349,29 @@ def remove_app_name_files(app_name: str) -> None:
     for file_path in get_app_name_files_for_app(app_name):
         os.remove(file_path)
 
+    get_app_name_index.cache_clear()
+
+
+def rename_app_dir(app_path: str, new_path: str) -> None:
+    """Replaces app directory at new_path with given one, keeping cached product info"""
+    shutil.rmtree(new_path, ignore_errors=True)
+    os.rename(app_path, new_path)
+
+    PRODUCT_INFO_CACHE.pop(new_path, None)
+
+    if app_path in PRODUCT_INFO_CACHE:
+        PRODUCT_INFO_CACHE[new_path] = PRODUCT_INFO_CACHE.pop(app_path)
+
 
 # There are a number of complications with directory name in application archive file:
 # 1. We can't guess dir name from archive file name - different products uses different conventions
 # 2. Some applications (MPS, Android Studio etc.) have the same directory name for different
 # application versions. To deal with this we have to return app_name from unpack procedure.
-def unpack_app(file_path: str) -> str:
-    """Unpacks specified file to app directory."""
+def unpack_app(file_path: str) -> Tuple[str, ProductInfo]:
+    """Unpacks specified file to app directory, returns app name and its product info."""
     if is_installed(file_path):  # Check if we already unpack the app
-        return get_app_name_for(file_path)
+        app_name = get_app_name_for(file_path)
+        return app_name, get_product_info(get_app_path(app_name))
 
     app_name = unpack_tar_file(file_path, get_apps_dir())
 
@@ -301,19 +381,15 @@ def unpack_app(file_path: str) -> str:
 
     if is_android_studio(product_info):
         versioned_name = app_name + "_" + product_info.version.replace(' ', '_')
-        new_path = get_app_path(versioned_name)
-        shutil.rmtree(new_path, ignore_errors=True)
-        os.rename(app_path, new_path)
+        rename_app_dir(app_path, get_app_path(versioned_name))
         app_name = versioned_name
     elif is_mps(product_info):
-        new_path = get_app_path(product_info.build_number)
-        shutil.rmtree(new_path, ignore_errors=True)
-        os.rename(app_path, new_path)
+        rename_app_dir(app_path, get_app_path(product_info.build_number))
         app_name = product_info.build_number
 
     save_app_name_for(file_path, app_name)
 
-    return app_name
+    return app_name, product_info
 
 
 def get_jre_dir(path_to_app: str) -> str:
@@ -332,11 +408,13 @@ def is_path_to_app(app_path: str) -> bool:
     return isfile(prod_info_path) or is_mps_dir(app_path)
 
 
+@lru_cache(maxsize=1)
 def get_toolbox_dir() -> str:
     """Returns full path to toolbox dir"""
     return expand_path(TOOLBOX_DEFAULT_DIR)
 
 
+@lru_cache(maxsize=1)
 def get_toolbox_settings_file() -> str:
     """Returns path to toolbox config"""
     return join(get_toolbox_dir(), TOOLBOX_SETTINGS)
@@ -344,21 +422,22 @@ def get_toolbox_settings_file() -> str:
 
 def is_toolbox_installed() -> bool:
     """Checks if toolbox is installed for current user"""
-    ret: bool = isdir(get_toolbox_dir())
-    ret = ret and isfile(get_toolbox_settings_file())
-    return ret
+    # settings file is inside toolbox dir, so a single stat checks both
+    return isfile(get_toolbox_settings_file())
 
 
+@lru_cache(maxsize=1)
 def get_toolbox_install_location() -> str:
     """
-    Returns path to toolbox install location or empty string if toolbox is not installed
+    Returns path to toolbox install location or empty string if toolbox is not installed.
+    The location is read once per process.
     """
 
     if not is_toolbox_installed():
         return ''
 
-    with open(get_toolbox_settings_file(), mode='r', encoding='utf-8') as settings_file:
-        data = json.load(settings_file)
+    with open(get_toolbox_settings_file(), mode='rb') as settings_file:
+        data = json_loads(settings_file.read())
 
         if 'install_location' in data:
             return str(data['install_location'])
@@ -383,47 +462,74 @@ def get_toolbox_apps_location() -> str:
 
 def get_path_to_toolbox_channel(path: str) -> Optional[str]:
     """"Returns path to toolbox channel"""
-    apps_path = get_toolbox_apps_location()
-    path = expand_path(path)
-    pos = path.find(apps_path)
+    channel_re = get_toolbox_channel_re()
+
+    if channel_re is None:
+        return None
 
-    if pos >= 0:
-        ch_path = path.rstrip('/')
-        ch_pos = ch_path.find('ch-')
+    match = channel_re.match(expand_path(path))
+    return match.group(0) if match else None
 
-        if ch_pos > pos:
-            sep_pos = ch_path.find('/', ch_pos + 1)
 
-            if sep_pos < 0:
-                return ch_path
+@lru_cache(maxsize=1)
+def get_toolbox_channel_re() -> Optional[Pattern[str]]:
+    """Returns regex matching path to toolbox channel"""
+    apps_path = get_toolbox_apps_location()
 
-            return ch_path[:sep_pos]
+    if not apps_path:
+        return None
 
-    return None
+    sep = re.escape(os.sep)
+    return re.compile(f'{re.escape(join(apps_path, ""))}(?:[^{sep}]*{sep})*?ch-[^{sep}]*')
 
 
 FORBIDDEN_TOOLBOX_APP_LIST = ['JetBrainsGateway', 'Projector', 'Toolbox']
+PREFETCH_WORKERS = 8
+
+
+def prefetch_app_product_info(app_dir: str) -> None:
+    """Loads product info for given directory to cache if it is an app directory"""
+    if is_path_to_app(app_dir):
+        get_product_info(app_dir)
+
+
+def prefetch_product_info(channel_paths: List[str]) -> None:
+    """
+    Concurrently loads product info for all apps in given toolbox channels,
+    so subsequent get_product_info calls are served from cache.
+    """
+    app_dirs: List[str] = []
+
+    for channel_path in channel_paths:
+        with os.scandir(channel_path) as entries:
+            app_dirs.extend(entry.path for entry in entries if entry.is_dir())
+
+    if len(app_dirs) < 2:  # nothing to parallelize, skip thread pool startup
+        return
+
+    with ThreadPoolExecutor(max_workers=min(PREFETCH_WORKERS, len(app_dirs))) as executor:
+        list(executor.map(prefetch_app_product_info, app_dirs))
 
 
 def get_toolbox_managed_app_path_list() -> List[str]:
     """Returns list of toolbox-managed apps paths"""
     apps_dir = get_toolbox_apps_location()
-    pre = [appname for appname in os.listdir(apps_dir) if isdir(join(apps_dir, appname))
-           and appname not in FORBIDDEN_TOOLBOX_APP_LIST]
+
+    with os.scandir(apps_dir) as entries:
+        pre = [entry.path for entry in entries if entry.is_dir()
+               and entry.name not in FORBIDDEN_TOOLBOX_APP_LIST]
 
     pre.sort()
-    res = []
+    channels: List[str] = []
 
-    for app_name in pre:
-        app_dir = join(apps_dir, app_name)
+    for app_dir in pre:
+        with os.scandir(app_dir) as entries:
+            channels.extend(entry.path for entry in entries
+                            if entry.name.startswith('ch-') and entry.is_dir())
 
-        for channel in os.listdir(app_dir):
-            full_path = join(app_dir, channel)
-            if channel.startswith('ch-') and isdir(full_path):
-                if get_path_to_latest_app(full_path) is not None:
-                    res.append(full_path)
+    prefetch_product_info(channels)
 
-    return res
+    return [channel for channel in channels if get_path_to_latest_app(channel) is not None]
 
 
 def get_toolbox_custom_name(app_path: str) -> str:
@@ -431,8 +537,8 @@ def get_toolbox_custom_name(app_path: str) -> str:
     file_path = join(app_path, CHANNEL_SETTINGS_FILE)
 
     if isfile(file_path):
-        with open(file_path, mode='r', encoding='utf-8') as file:
-            data = json.load(file)
+        with open(file_path, mode='rb') as file:
+            data = json_loads(file.read())
 
             if 'custom_name' in data:
                 return str(data['custom_name'])
@@ -463,6 +569,7 @@ def get_toolbox_app_name(app_path: str) -> str:
     return name
 
 
+@lru_cache(maxsize=128)
 def toolbox_path_to_display_name(app_path: str) -> str:
     """Maps toolbox path to display name """
     toolbox_name = get_toolbox_app_name(app_path)
@@ -482,18 +589,23 @@ def toolbox_path_to_display_name(app_path: str) -> str:
 
 def get_toolbox_managed_apps() -> List[str]:
     """Returns list of toolbox managed apps"""
-    path_list = get_toolbox_managed_app_path_list()
-    res = list(map(toolbox_path_to_display_name, path_list))
-    res.sort()
+    return sorted(map(toolbox_path_to_display_name, get_toolbox_managed_app_path_list()))
+
+
+@lru_cache(maxsize=1)
+def get_toolbox_app_paths_by_name() -> Dict[str, str]:
+    """Returns mapping from display name to path for toolbox managed apps"""
+    res: Dict[str, str] = {}
+
+    for path in get_toolbox_managed_app_path_list():
+        res.setdefault(toolbox_path_to_display_name(path), path)
 
     return res
 
 
 def get_path_to_toolbox_app(toolbox_app_name: str) -> Optional[str]:
     """Returns path to toolbox app/channel by toolbox paa name """
-    return next(
-        filter(lambda s: toolbox_path_to_display_name(s) == toolbox_app_name,
-               get_toolbox_managed_app_path_list()))
+    return get_toolbox_app_paths_by_name().get(toolbox_app_name)
 
 
 def is_valid_app_path(app_path: str) -> bool:
@@ -508,20 +620,14 @@ def get_path_to_latest_app(path: str) -> Optional[str]:
     if channel_path is None:
         return None
 
-    app_path = None
-    app_ver = None
-
-    for sub_dir in listdir(channel_path):
-        app_dir = join(channel_path, sub_dir)
-
-        if isdir(app_dir) and is_path_to_app(app_dir):
-            ver = LooseVersion(get_product_info(app_dir).version)
+    with os.scandir(channel_path) as entries:
+        apps = [(get_version_key(get_product_info(entry.path).version), entry.path)
+                for entry in entries if entry.is_dir() and is_path_to_app(entry.path)]
 
-            if app_path is None or app_ver < ver:
-                app_path = app_dir
-                app_ver = ver
+    if not apps:
+        return None
 
-    return app_path
+    return max(apps, key=lambda it: it[0])[1]
 
 
 def get_product_name(app_path: str) -> str:
@@ -551,14 +657,31 @@ def is_projector_installed_ide(path_to_ide: str) -> bool:
     return ide_path.startswith(get_apps_dir())
 
 
+def contains_line(content: bytes, line: bytes) -> bool:
+    """Checks if given file content contains given string as a separate line"""
+    return b'\n' + line + b'\n' in b'\n' + content + b'\n'
+
+
 def is_disabled(file_name: str, plugin_name: str) -> bool:
     """Checks if given plugin is already disabled"""
     if not isfile(file_name):
         return False
 
-    with open(file_name, mode='r', encoding='utf-8') as file:
-        lines = [line.strip() for line in file]
-        return plugin_name in lines
+    with open(file_name, mode='rb') as file:
+        return contains_line(file.read(), plugin_name.encode())
+
+
+def append_line(file_name: str, line: str) -> None:
+    """Appends line to the file unless the file already contains it"""
+    with open(file_name, mode='a+b', buffering=0) as file:
+        file.seek(0)
+        content = file.read()
+
+        if contains_line(content, line.encode()):
+            return
+
+        prefix = b'\n' if content and not content.endswith(b'\n') else b''
+        file.write(prefix + line.encode() + b'\n')
 
 
 def disable_plugin(file_name: str, plugin_name: str) -> None:
@@ -566,32 +689,18 @@ def disable_plugin(file_name: str, plugin_name: str) -> None:
     directory = dirname(file_name)
     create_dir_if_not_exist(directory)
 
-    with open(file_name, mode='a', encoding='utf-8') as file:
-        file.write(f'{plugin_name}')
+    append_line(file_name, plugin_name)
 
 
-def get_ide_properties_file(app_path: str) -> str:
+def get_ide_properties_file(app_path: str, product_info: Optional[ProductInfo] = None) -> str:
     """Returns path to ide properties file"""
-    bin_dir = get_bin_dir(app_path)
+    bin_dir = get_bin_dir(app_path, product_info)
     return join(bin_dir, IDEA_PROPERTIES_FILE)
 
 
-def is_updates_forbidden(app_path: str) -> bool:
-    """Returns True if updates for specified IDE is already forbidden"""
-    prop_file = get_ide_properties_file(app_path)
-    with open(prop_file, mode='r', encoding='utf-8') as file:
-        lines = file.read().splitlines()
-        return FORBID_UPDATE_STRING in lines
-
-
-def forbid_updates_for(app_path: str) -> None:
+def forbid_updates_for(app_path: str, product_info: Optional[ProductInfo] = None) -> None:
     """Forbids IDEA platform update for specified app."""
-
-    if not is_updates_forbidden(app_path):
-        prop_file = get_ide_properties_file(app_path)
-
-        with open(prop_file, mode='a', encoding='utf-8') as file:
-            file.write(FORBID_UPDATE_STRING)
+    append_line(get_ide_properties_file(app_path, product_info), FORBID_UPDATE_STRING)
 
 
 def download_and_install(url: str) -> str:
@@ -603,43 +712,45 @@ def download_and_install(url: str) -> str:
         sys.exit(1)
 
     try:
-        app_name = unpack_app(path_to_dist)
+        app_name, product_info = unpack_app(path_to_dist)
     except IOError as error:
         print(f'Unable to extract the archive: {str(error)}, exiting...')
         sys.exit(1)
 
     res = get_app_path(app_name)
-    forbid_updates_for(res)
+    forbid_updates_for(res, product_info)
 
     return res
 
 
 def get_config_dir(app_path: str) -> str:
     """Returns ide config directory."""
-    product_info = get_product_info(app_path)
-    version = parse_version(product_info.version)
-
-    if is_android_studio(product_info):
-        return join(ANDROID_STUDIO_CONFIG_PREFIX, product_info.data_dir)
-
-    if version.year >= 2020:
-        return join(VER_2020_CONFIG_PREFIX, product_info.data_dir)
-
-    return join(join(CONFIG_PREFIX, '.' + product_info.data_dir), 'config')
+    return get_ide_dirs(app_path)[0]
 
 
 def get_plugins_dir(app_path: str) -> str:
     """Returns full path to application plugin directory."""
+    return get_ide_dirs(app_path)[1]
+
+
+def get_ide_dirs(app_path: str) -> Tuple[str, str]:
+    """Returns ide config and plugin directories."""
     product_info = get_product_info(app_path)
-    version = parse_version(product_info.version)
+    year = parse_version(product_info.version).year
+    return _get_ide_dirs(product_info.data_dir, is_android_studio(product_info), year)
 
-    if is_android_studio(product_info):
-        return join(ANDROID_STUDIO_PLUGIN_PREFIX, product_info.data_dir)
 
-    if version.year >= 2020:
-        return join(PLUGIN_2020_PREFIX, product_info.data_dir)
+@lru_cache(maxsize=64)
+def _get_ide_dirs(data_dir: str, is_as: bool, year: int) -> Tuple[str, str]:
+    if is_as:
+        return join(ANDROID_STUDIO_CONFIG_PREFIX, data_dir), \
+               join(ANDROID_STUDIO_PLUGIN_PREFIX, data_dir)
 
-    return join(get_config_dir(app_path), "plugins")
+    if year >= 2020:
+        return join(VER_2020_CONFIG_PREFIX, data_dir), join(PLUGIN_2020_PREFIX, data_dir)
+
+    config_dir = join(CONFIG_PREFIX, '.' + data_dir, 'config')
+    return config_dir, join(config_dir, 'plugins')
 
 
 NO_PLUGIN_NOTIFICATION = """
@@ -657,17 +768,12 @@ def forbid_plugin_update_notifications_in_file(notifications_config: str) -> Non
     tree: Element = parsed.getroot()
 
     try:
-        nodes = tree.findall('./component/notification[@groupId="Plugins updates"]')
+        nodes = tree.findall(UPDATES_NOTIFICATION_PATH)
 
         if len(nodes) < 1:
             raise KeyError
 
-        node = nodes[0]
-
-        if node.attrib is None:
-            node.attrib = UPDATES_ATTRIBUTES
-        else:
-            node.attrib = {**node.attrib, **UPDATES_ATTRIBUTES}
+        nodes[0].attrib.update(UPDATES_ATTRIBUTES)
 
     except KeyError:
         try:
@@ -3,29 +3,34 @@
 #  in the LICENSE file.
 
 """Functions related to obtaining certificate chain file"""
+# Crypto modules are heavy to import and needed only when user provides a certificate,
+# so they are imported in functions below rather than at module level.
+# pylint: disable=import-outside-toplevel
+from os import remove
 from tempfile import NamedTemporaryFile
-from typing import Tuple
+from typing import Tuple, TYPE_CHECKING
 from urllib.request import urlopen
 
-from OpenSSL import crypto  # type: ignore
-from OpenSSL.crypto import _lib, _ffi, X509  # type: ignore
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
-from cryptography.x509 import oid, load_der_x509_certificate, load_pem_x509_certificate
-from cryptography.x509.extensions import ExtensionNotFound  # type: ignore
-from cryptography.x509.extensions import AuthorityInformationAccess  # type: ignore
-from cryptography.x509.oid import ExtensionOID  # type: ignore
+if TYPE_CHECKING:
+    from cryptography.x509 import Certificate
 
-
-def convert_der_to_pem(der_data: bytes) -> bytes:
-    """Convert certificate from DER to PEM format"""
-    cert = load_der_x509_certificate(der_data, default_backend())
-    return cert.public_bytes(serialization.Encoding.PEM)
+MAX_CERTIFICATE_SIZE = 1024 * 1024
 
 
 def get_aia_location_from_cert(cert_data: bytes) -> str:
-    """Extract AIA location CA_ISSUERS URL from certificate if exist"""
-    cert = load_pem_x509_certificate(cert_data, default_backend())
+    """Extract AIA location CA_ISSUERS URL from PEM certificate data if exist"""
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.x509 import load_pem_x509_certificate
+
+    return get_aia_location(load_pem_x509_certificate(cert_data, default_backend()))
+
+
+def get_aia_location(cert: 'Certificate') -> str:
+    """Extract AIA location CA_ISSUERS URL from parsed certificate if exist"""
+    from cryptography.x509 import oid
+    from cryptography.x509.extensions import ExtensionNotFound  # type: ignore
+    from cryptography.x509.extensions import AuthorityInformationAccess  # type: ignore
+    from cryptography.x509.oid import ExtensionOID  # type: ignore
 
     if cert.issuer == cert.subject:  # root (or self-signed) certificate
         return ''
@@ -57,12 +62,20 @@ def download_certificate(url: str) -> Tuple[bool, bytes]:
         if code != 200:
             raise IOError(f'HTTP error code: {code}')
 
-        return is_pkcs7_data(resp.headers['Content-Type']), bytes(resp.read())
+        data = resp.read(MAX_CERTIFICATE_SIZE + 1)
+
+        if len(data) > MAX_CERTIFICATE_SIZE:
+            raise IOError(f'Certificate size exceeds {MAX_CERTIFICATE_SIZE} bytes: {url}')
+
+        return is_pkcs7_data(resp.headers['Content-Type']), data
 
 
 # pylint: disable=protected-access
 def get_pem_data_from_pkcs7(data: bytes) -> bytes:
     """Extracts certificate from pkcs7 data and convert it to PEM data"""
+    from OpenSSL import crypto  # type: ignore
+    from OpenSSL.crypto import _lib, _ffi, X509  # type: ignore
+
     pkcs7 = crypto.load_pkcs7_data(crypto.FILETYPE_ASN1, data)
     certs = _ffi.NULL
 
@@ -82,25 +95,35 @@ def get_pem_data_from_pkcs7(data: bytes) -> bytes:
 
 def get_certificate_chain(path_to_certificate: str) -> str:
     """Retrieves and stores certificate chain for given certificate if possible"""
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.x509 import load_der_x509_certificate, load_pem_x509_certificate
+
     with open(path_to_certificate, 'rb') as file:
         next_cert_url = get_aia_location_from_cert(file.read())
-        chain_data: bytes = bytes()
 
-        while next_cert_url:
-            is_pkcs7, data = download_certificate(next_cert_url)
+    if not next_cert_url:
+        return ''
 
-            if is_pkcs7:
-                pem_data = get_pem_data_from_pkcs7(data)
-            else:
-                pem_data = convert_der_to_pem(data)
+    backend = default_backend()
 
-            chain_data += pem_data
+    with NamedTemporaryFile(suffix='.pem', delete=False, mode='wb') as res:
+        try:
+            while next_cert_url:
+                is_pkcs7, data = download_certificate(next_cert_url)
 
-            next_cert_url = get_aia_location_from_cert(pem_data)
+                if is_pkcs7:
+                    pem_data = get_pem_data_from_pkcs7(data)
+                    cert = load_pem_x509_certificate(pem_data, backend)
+                else:
+                    cert = load_der_x509_certificate(data, backend)
+                    pem_data = cert.public_bytes(serialization.Encoding.PEM)
 
-    if chain_data:
-        with NamedTemporaryFile(suffix='.pem', delete=False, mode='wb') as res:
-            res.write(chain_data)
-            return res.name
+                res.write(pem_data)
 
-    return ''
+                next_cert_url = get_aia_location(cert)
+        except Exception:
+            remove(res.name)
+            raise
+
+    return res.name
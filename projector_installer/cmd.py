@@ -5,34 +5,69 @@
 
 """Command line interface to projector-installer"""
 import sys
-from os import path, getcwd, getenv
-from typing import Any, Optional
+from os import getenv, stat
+from typing import Any, Optional, List, Set, Tuple
 import click
 
 from . import global_config
-from .apps import is_valid_app_path
 from .global_config import init_config_dir, init_cache_dir
+from .utils import expand_path, expand_path_lazy
 
-from .actions import do_install_app, do_uninstall_app, do_find_app, do_list_app, do_run_config, \
-    do_list_config, do_show_config, do_add_config, do_remove_config, do_edit_config, \
-    do_rename_config, do_rebuild_config, do_install_cert, do_update_config, do_auto_install, \
-    do_save_defaults, do_self_update, do_auto_add_config
-from .license import display_license
-from .projector_updates import check_for_projector_updates
-from .secure_config import is_required_ca_migration, do_ca_migration
-from .utils import expand_path
+# Actions, license, updates and secure config modules are imported where they are used:
+# only the modules needed by invoked command are loaded, --help and --version load none.
+# pylint: disable=import-outside-toplevel
 
 
 def is_first_start() -> bool:
     """Detects first app start."""
-    return not path.isdir(global_config.config_dir)
+    return not global_config.is_config_dir_exist(global_config.config_dir)
+
+
+# Commands which only show local information
+READ_ONLY_COMMANDS = {('find',), ('ide', 'find'), ('ide', 'list'),
+                      ('config', 'list'), ('config', 'show')}
+# Commands which only show local information or update projector itself
+NO_UPDATE_CHECK_COMMANDS = READ_ONLY_COMMANDS | {('self-update',)}
+HELP_OPTIONS = {'--help', '--version'}
+
+
+def is_command_in(subcommand: str, args: List[str], commands: Set[Tuple[str, ...]]) -> bool:
+    """Returns True if command given by subcommand and its args is one of specified commands"""
+    if subcommand not in args:
+        return False
+
+    pos = args.index(subcommand)
+    command = tuple(args[pos:pos + 2])
+    return command[:1] in commands or command in commands
+
+
+def is_update_check_required(subcommand: Optional[str], args: List[str]) -> bool:
+    """Returns True if projector-installer update check makes sense for given command line"""
+    if not HELP_OPTIONS.isdisjoint(args):
+        return False
+
+    if subcommand is None:  # help or first start installation
+        return False
+
+    return not is_command_in(subcommand, args, NO_UPDATE_CHECK_COMMANDS)
+
+
+def is_read_only_command(subcommand: Optional[str], args: List[str]) -> bool:
+    """Returns True if given command line neither downloads nor changes anything"""
+    if subcommand is None:  # help or first start installation
+        return False
+
+    if not HELP_OPTIONS.isdisjoint(args):
+        return True
+
+    return is_command_in(subcommand, args, READ_ONLY_COMMANDS)
 
 
 def is_cwd_exist() -> bool:
     """Checks cwd existence"""
     try:
-        getcwd()
-        return True
+        # removed directory still can be stat'ed, but has no links
+        return stat('.').st_nlink > 0
     except FileNotFoundError:
         return False
 
@@ -41,46 +76,61 @@ def is_cwd_exist() -> bool:
 @click.pass_context
 @click.version_option()
 @click.option('--config-directory', type=click.Path(),
-              default=global_config.config_dir,
+              default=None,
               help='Path to configuration directory')
 @click.option('--cache-directory', type=click.Path(),
               default='',
               help='Path to download cache directory')
 @click.option('--accept-license', default=False, is_flag=True,
               help='Accept GPL v2 license without prompt.')
-def projector(ctx: Any, config_directory: str, cache_directory: str, accept_license: bool) -> None:
+def projector(ctx: Any, config_directory: Optional[str], cache_directory: str,
+              accept_license: bool) -> None:
     """
     This script helps to install, manage, and run JetBrains IDEs with Projector.
     """
 
     if not is_cwd_exist():
         it = getenv('PWD', 'it')  # pylint: disable=invalid-name
-        print(f'Could not determine current working directory. Does {it} exist? Exiting...')
+        click.echo(f'Could not determine current working directory. Does {it} exist? Exiting...')
         sys.exit(1)
 
-    if ctx.invoked_subcommand != 'self-update':
-        check_for_projector_updates()
+    # config dir is resolved: installed IDE paths are compared against it
+    global_config.config_dir = expand_path(config_directory or global_config.config_dir)
 
-    global_config.config_dir = expand_path(config_directory)
+    # --accept-license is used by scripted invocations, nobody reads update notices there
+    if not accept_license and is_update_check_required(ctx.invoked_subcommand, sys.argv[1:]):
+        from .projector_updates import check_for_projector_updates
+
+        check_for_projector_updates()
 
     if cache_directory:
-        global_config.cache_dir = expand_path(cache_directory)
+        # cache dir is usually created by init_cache_dir, no symlinks to resolve
+        global_config.cache_dir = expand_path_lazy(cache_directory)
 
-    if is_required_ca_migration():
-        do_ca_migration()
+    read_only = is_read_only_command(ctx.invoked_subcommand, sys.argv[1:])
+
+    if not read_only:
+        from .secure_config import is_required_ca_migration, do_ca_migration
+
+        if is_required_ca_migration():
+            do_ca_migration()
 
     if is_first_start():
         if not accept_license:
+            from .license import display_license
+
             display_license()
 
         init_config_dir()
 
         if not ctx.invoked_subcommand:
-            print('Please select IDE to install:')
+            from .actions import do_install_app
+
+            click.echo('Please select IDE to install:')
             do_install_app(None, auto_run=True, run_browser=True, quick=True)
     elif not ctx.invoked_subcommand:
         click.echo(ctx.get_help())
-    else:
+    elif not read_only:
         init_cache_dir()
 
 
@@ -92,6 +142,8 @@ def find_app(pattern: Optional[str]) -> None:
     Find projector-compatible IDE with the name matching to the given pattern.
     If no pattern is specified, finds all the compatible IDEs.
     """
+    from .actions import do_find_app
+
     do_find_app(pattern)
 
 
@@ -104,6 +156,8 @@ def uninstall(name_pattern: Optional[str]) -> None:
     If no name pattern is given or the pattern is ambiguous, guides the user through the
     uninstall process.
     """
+    from .actions import do_uninstall_app
+
     do_uninstall_app(name_pattern)
 
 
@@ -115,6 +169,8 @@ def list_apps(pattern: Optional[str]) -> None:
     Displays installed IDEs whose names matches to given pattern.
     If no pattern is given, lists all installed IDEs.
     """
+    from .actions import do_list_app
+
     do_list_app(pattern)
 
 
@@ -126,6 +182,8 @@ def list_config(pattern: Optional[str]) -> None:
     Displays configurations whose names matches to the given pattern.
     If no pattern is given, lists all the configurations.
     """
+    from .actions import do_list_config
+
     do_list_config(pattern)
 
 
@@ -137,6 +195,8 @@ def show(config_name: Optional[str]) -> None:
     Parameter config_name specifies a desired configuration.
     If not given or ambiguous, selects a configuration interactively.
     """
+    from .actions import do_show_config
+
     do_show_config(config_name)
 
 
@@ -167,6 +227,9 @@ def add(config_name: Optional[str],
 
     Add a new configuration.
     """
+    from .apps import is_valid_app_path
+    from .actions import do_auto_add_config, do_add_config
+
     app_path: str = ide_path if ide_path else ''
 
     if config_name and is_valid_app_path(app_path) and port and hostname:
@@ -188,6 +251,8 @@ def remove(config_name: Optional[str], uninstall_ide: bool) -> None:
 
     Remove an existing configuration.
     """
+    from .actions import do_remove_config
+
     do_remove_config(config_name, uninstall_ide)
 
 
@@ -198,6 +263,8 @@ def edit(config_name: Optional[str]) -> None:
 
     Change an existing configuration.
     """
+    from .actions import do_edit_config
+
     do_edit_config(config_name)
 
 
@@ -209,6 +276,8 @@ def rename(from_name: str, to_name: str) -> None:
 
     Rename an existing configuration.
     """
+    from .actions import do_rename_config
+
     do_rename_config(from_name, to_name)
 
 
@@ -219,6 +288,8 @@ def rebuild(config_name: Optional[str]) -> None:
 
     Regenerate all files related to given config.
     """
+    from .actions import do_rebuild_config
+
     do_rebuild_config(config_name)
 
 
@@ -231,6 +302,8 @@ def run(config_name: Optional[str], run_browser: bool) -> None:
 
     Shortcut for projector config run config_name
     """
+    from .actions import do_run_config
+
     do_run_config(config_name, run_browser)
 
 
@@ -242,6 +315,8 @@ def update(config_name: Optional[str]) -> None:
     Updates IDE in selected config if update is available
     Updates IDE in selected config if update is available
     """
+    from .actions import do_update_config
+
     do_update_config(config_name)
 
 
@@ -263,6 +338,8 @@ def install_app(ide_name: Optional[str],
     If no IDE name is given or the pattern is ambiguous, guides the user through the
     install process.
     """
+    from .actions import do_install_app
+
     do_install_app(ide_name, auto_run, run_browser, not expert)
 
 
@@ -287,6 +364,7 @@ def auto_install_app(config_name: str,
     projector ide autoinstall --config-name name --ide-name name
     [--port listen_port] [--hostname hostname or address]
     """
+    from .actions import do_auto_install
 
     do_auto_install(config_name, ide_name, port, hostname,
                     use_separate_config, password, ro_password)
@@ -304,6 +382,8 @@ def install_certificate(config_name: Optional[str], certificate: Optional[str],
 
     Adds user-specified certificate to given config
     """
+    from .actions import do_install_cert
+
     do_install_cert(config_name, certificate, key, chain)
 
 
@@ -314,6 +394,8 @@ def defaults(hostname: Optional[str]) -> None:
 
     Configure projector defaults
     """
+    from .actions import do_save_defaults
+
     do_save_defaults(hostname)
 
 
@@ -323,6 +405,8 @@ def self_update() -> None:
 
     Update projector-installer
     """
+    from .actions import do_self_update
+
     do_self_update()
 
 
@@ -340,29 +424,32 @@ def config() -> None:
     """
 
 
-# IDE commands
-ide.add_command(find_app, name='find')
-ide.add_command(list_apps, name='list')
-ide.add_command(install_app, name='install')
-ide.add_command(uninstall, name='uninstall')
-ide.add_command(auto_install_app, name='autoinstall')
-
-# Config commands
-config.add_command(list_config, name='list')
-config.add_command(show, name='show')
-config.add_command(add, name='add')
-config.add_command(remove, name='remove')
-config.add_command(edit, name='edit')
-config.add_command(rename, name='rename')
-config.add_command(rebuild, name='rebuild')
-config.add_command(run, name='run')
-config.add_command(update, name='update')
-
-# Shortcut commands
-projector.add_command(find_app, name='find')
-projector.add_command(run, name='run')
-projector.add_command(install_app, name='install')
-projector.add_command(auto_install_app, name='autoinstall')
-projector.add_command(install_certificate, name='install-certificate')
-projector.add_command(defaults, name='defaults')
-projector.add_command(self_update, name='self-update')
+COMMANDS = (
+    # IDE commands
+    (ide, 'find', find_app),
+    (ide, 'list', list_apps),
+    (ide, 'install', install_app),
+    (ide, 'uninstall', uninstall),
+    (ide, 'autoinstall', auto_install_app),
+    # Config commands
+    (config, 'list', list_config),
+    (config, 'show', show),
+    (config, 'add', add),
+    (config, 'remove', remove),
+    (config, 'edit', edit),
+    (config, 'rename', rename),
+    (config, 'rebuild', rebuild),
+    (config, 'run', run),
+    (config, 'update', update),
+    # Shortcut commands
+    (projector, 'find', find_app),
+    (projector, 'run', run),
+    (projector, 'install', install_app),
+    (projector, 'autoinstall', auto_install_app),
+    (projector, 'install-certificate', install_certificate),
+    (projector, 'defaults', defaults),
+    (projector, 'self-update', self_update),
+)
+
+for cmd_group, cmd_name, cmd in COMMANDS:
+    cmd_group.add_command(cmd, name=cmd_name)
@@ -4,20 +4,20 @@
 
 """Run config generation stuff"""
 
-import configparser
 import io
-from os import stat, chmod
+import re
+from functools import lru_cache
+from os import stat, fstat, fchmod, open as os_open, O_EXCL
 from os.path import join
-from pathlib import Path
 from shlex import quote
-from typing import TextIO
-from shutil import copy
+from typing import TextIO, Dict, Optional, Pattern
 
 from .apps import get_launch_script, get_ide_properties_file, IDEA_PROPERTIES_FILE, \
-    forbid_updates_for, forbid_plugin_update_notifications
+    forbid_updates_for, forbid_plugin_update_notifications, get_product_info, ProductInfo
 from .global_config import get_projector_server_dir, get_ssl_properties_file
 from .run_config import RunConfig, get_run_script_path, CONFIG_INI_NAME
 from .secure_config import generate_server_secrets
+from .utils import write_ini_file
 
 IDEA_RUN_CLASS = 'com.intellij.idea.Main'
 PROJECTOR_RUN_CLASS = 'org.jetbrains.projector.server.ProjectorLauncher'
@@ -67,62 +67,97 @@ def launch_script_last_lines(run_config: RunConfig, main_class: str) -> str:
     return line
 
 
-def write_run_script(run_config: RunConfig, src: TextIO, dst: TextIO) -> None:
-    """Writes run script from src to dst"""
+# Lines of IDE launch script to be replaced, alternatives are listed in priority order
+RUN_SCRIPT_LINES = [
+    ('ide_bin_home', r'IDE_BIN_HOME.*'),
+    ('CLASSPATH', r'(?=.*CLASSPATH).*-classpath.*'),
+    ('CLASS_PATH', r'.*-classpath.*'),
+    ('ide_properties', r'.*\$\{IDE_PROPERTIES_PROPERTY\}.*'),
+    ('idea_main', f'.*{re.escape(IDEA_RUN_CLASS)}.*'),
+    ('mps_main', f'.*{re.escape(MPS_MAIN_CLASS)}.*'),
+]
+
 
-    for line in src:
-        class_path_var = 'CLASS_PATH'
+@lru_cache(maxsize=2)
+def get_run_script_re(use_separate_config: bool) -> Pattern[str]:
+    """Returns regex matching launch script lines to be replaced"""
+    alternatives = [f'^(?P<{name}>{line})\n?' for name, line in RUN_SCRIPT_LINES
+                    if use_separate_config or name != 'ide_properties']
+    return re.compile('|'.join(alternatives), re.MULTILINE)
 
-        if line.find('CLASSPATH') != -1:
-            class_path_var = 'CLASSPATH'
 
-        if line.startswith("IDE_BIN_HOME"):
-            line = f'IDE_BIN_HOME={quote(join(run_config.path_to_app, "bin"))}\n'
-        elif line.find("-classpath") != -1:
-            line = f' -classpath "${class_path_var}:{get_projector_server_dir()}/*" \\\n'
-        elif run_config.use_separate_config and line.find('${IDE_PROPERTIES_PROPERTY}') != -1:
-            line = f' -Didea.properties.file=' \
-                   f'{join(run_config.get_path(), IDEA_PROPERTIES_FILE)} \\\n'
-        elif line.find(IDEA_RUN_CLASS) != -1:
-            line = launch_script_last_lines(run_config, IDEA_RUN_CLASS)
-        elif line.find(MPS_MAIN_CLASS) != -1:
-            line = launch_script_last_lines(run_config, MPS_MAIN_CLASS)
+def get_run_script_replacements(run_config: RunConfig) -> Dict[str, str]:
+    """Returns replacements for launch script lines of given run config"""
+    server_classpath = f'{get_projector_server_dir()}/*'
 
-        dst.write(line)
+    return {
+        'ide_bin_home': f'IDE_BIN_HOME={quote(join(run_config.path_to_app, "bin"))}\n',
+        'CLASSPATH': f' -classpath "$CLASSPATH:{server_classpath}" \\\n',
+        'CLASS_PATH': f' -classpath "$CLASS_PATH:{server_classpath}" \\\n',
+        'ide_properties': f' -Didea.properties.file='
+                          f'{join(run_config.get_path(), IDEA_PROPERTIES_FILE)} \\\n',
+        'idea_main': launch_script_last_lines(run_config, IDEA_RUN_CLASS),
+        'mps_main': launch_script_last_lines(run_config, MPS_MAIN_CLASS),
+    }
 
 
-def make_run_script(run_config: RunConfig, run_script: str) -> None:
+def write_run_script(run_config: RunConfig, src: TextIO, dst: TextIO) -> None:
+    """Writes run script from src to dst"""
+    regex = get_run_script_re(run_config.use_separate_config)
+    replacements = get_run_script_replacements(run_config)
+    dst.write(regex.sub(lambda match: replacements[str(match.lastgroup)], src.read()))
+
+
+def open_executable(file_name: str, flags: int) -> int:
+    """Opens file and makes it executable, new file is created executable (respecting umask)"""
+    try:
+        return os_open(file_name, flags | O_EXCL, 0o777)
+    except FileExistsError:
+        fd = os_open(file_name, flags)  # pylint: disable=invalid-name
+        fchmod(fd, fstat(fd).st_mode | 0o0111)
+        return fd
+
+
+def make_run_script(run_config: RunConfig, run_script: str,
+                    product_info: Optional[ProductInfo] = None) -> None:
     """Creates run script from ide launch script."""
-    idea_script = get_launch_script(run_config.path_to_app)
+    idea_script = get_launch_script(run_config.path_to_app, product_info)
 
     with open(idea_script, mode='r', encoding='utf-8') as src, \
-            open(run_script, mode='w', encoding='utf-8') as dst:
+            open(run_script, mode='w', encoding='utf-8', opener=open_executable) as dst:
         write_run_script(run_config, src, dst)
 
-    stats = stat(run_script)
-    chmod(run_script, stats.st_mode | 0o0111)
-
 
 def check_run_script(run_config: RunConfig, run_script_name: str) -> bool:
     """Check if run script corresponds to given config"""
     idea_script = get_launch_script(run_config.path_to_app)
-    with open(idea_script, mode='r', encoding='utf-8') as src, \
-            open(run_script_name, mode='r', encoding='utf-8') as run_script:
+
+    with open(idea_script, mode='r', encoding='utf-8') as src:
         dst = io.StringIO()
         write_run_script(run_config, src, dst)
-        dst.seek(0)
-        return dst.read() == run_script.read()
+
+    expected = dst.getvalue().encode('utf-8')
+
+    if stat(run_script_name).st_size != len(expected):
+        return False
+
+    with open(run_script_name, mode='rb') as run_script:
+        return run_script.read() == expected
 
 
-def generate_run_script(run_config: RunConfig) -> None:
+def generate_run_script(run_config: RunConfig,
+                        product_info: Optional[ProductInfo] = None) -> None:
     """Generates projector run script"""
     run_script = get_run_script_path(run_config.name)
-    make_run_script(run_config, run_script)
+    make_run_script(run_config, run_script, product_info)
 
 
-def copy_idea_properties_file(run_config: RunConfig) -> None:
+def copy_idea_properties_file(run_config: RunConfig,
+                              product_info: Optional[ProductInfo] = None) -> None:
     """Copies idea.properties file from install dir to run config"""
-    copy(get_ide_properties_file(run_config.path_to_app), run_config.get_path())
+    from shutil import copy  # pylint: disable=import-outside-toplevel
+
+    copy(get_ide_properties_file(run_config.path_to_app, product_info), run_config.get_path())
 
 
 IDEA_CONFIG_PATH_PROPERTY = 'idea.config.path'
@@ -131,35 +166,41 @@ IDEA_LOG_PATH_PROPERTY = 'idea.log.path'
 IDEA_PLUGINS_PATH_PROPERTY = 'idea.plugins.path'
 
 
-def create_idea_properties_file(run_config: RunConfig) -> None:
+def create_idea_properties_file(run_config: RunConfig,
+                                product_info: Optional[ProductInfo] = None) -> None:
     """Copies idea.properties file from install dir to run config
     and set idea.config.path, idea.system.path,
     idea.log.path and idea.plugin.path properties
     """
-    copy_idea_properties_file(run_config)
-    prop_file_path = join(run_config.get_path(), IDEA_PROPERTIES_FILE)
+    copy_idea_properties_file(run_config, product_info)
+    config_path = run_config.get_path()
+    prop_file_path = join(config_path, IDEA_PROPERTIES_FILE)
+    properties = (f'\n{IDEA_CONFIG_PATH_PROPERTY}={config_path}/config'
+                  f'\n{IDEA_SYSTEM_PATH_PROPERTY}={config_path}/system'
+                  f'\n{IDEA_LOG_PATH_PROPERTY}={config_path}/log'
+                  f'\n{IDEA_PLUGINS_PATH_PROPERTY}={config_path}/plugins')
+
     with open(prop_file_path, mode='a', encoding='utf-8') as prop_file:
-        prop_file.write(f'\n{IDEA_CONFIG_PATH_PROPERTY}={run_config.get_path()}/config')
-        prop_file.write(f'\n{IDEA_SYSTEM_PATH_PROPERTY}={run_config.get_path()}/system')
-        prop_file.write(f'\n{IDEA_LOG_PATH_PROPERTY}={run_config.get_path()}/log')
-        prop_file.write(f'\n{IDEA_PLUGINS_PATH_PROPERTY}={run_config.get_path()}/plugins')
+        prop_file.write(properties)
 
 
 def save_config(run_config: RunConfig) -> None:
     """Saves given run config."""
-    config = configparser.ConfigParser(strict=False, interpolation=None)
-    config['IDE'] = {}
-    config['IDE']['PATH'] = run_config.path_to_app
-    config['IDE']['USE_SEPARATE_CONFIG'] = 'True' \
-        if run_config.use_separate_config else 'False'  # type: ignore
-
-    config['PROJECTOR'] = {}
-    config['PROJECTOR']['PORT'] = str(run_config.projector_port)
-    config['PROJECTOR']['HOST'] = run_config.projector_host
+    from pathlib import Path  # pylint: disable=import-outside-toplevel
+
+    config: Dict[str, Dict[str, str]] = {
+        'IDE': {
+            'PATH': run_config.path_to_app,
+            'USE_SEPARATE_CONFIG': 'True' if run_config.use_separate_config else 'False'
+        },
+        'PROJECTOR': {
+            'PORT': str(run_config.projector_port),
+            'HOST': run_config.projector_host
+        }
+    }
 
     if run_config.is_secure():
-        config['SSL'] = {}
-        config['SSL']['TOKEN'] = run_config.token
+        config['SSL'] = {'TOKEN': run_config.token}
 
         if run_config.certificate:
             config['SSL']['CERTIFICATE_FILE'] = run_config.certificate
@@ -167,36 +208,32 @@ def save_config(run_config: RunConfig) -> None:
             config['SSL']['CHAIN_FILE'] = run_config.certificate_chain
 
     if run_config.is_password_protected():
-        config['PASSWORDS'] = {}
-        config['PASSWORDS']['PASSWORD'] = run_config.password  # type: ignore
-        config['PASSWORDS']['RO_PASSWORD'] = run_config.ro_password  # type: ignore
+        config['PASSWORDS'] = {
+            'PASSWORD': run_config.password,
+            'RO_PASSWORD': run_config.ro_password
+        }
 
     if run_config.toolbox:
-        config['TOOLBOX'] = {}
-        config['TOOLBOX']['TOOLBOX'] = 'True'  # type: ignore
+        config['TOOLBOX'] = {'TOOLBOX': 'True'}
 
     if run_config.custom_names:
-        config['FQDNS'] = {}
-        config['FQDNS']['FQDNS'] = run_config.custom_names  # type: ignore
+        config['FQDNS'] = {'FQDNS': run_config.custom_names}
 
-    config['UPDATE'] = {}
-    config['UPDATE']['CHANNEL'] = run_config.update_channel
+    config['UPDATE'] = {'CHANNEL': run_config.update_channel}
 
     config_path = run_config.get_path()
 
     Path(config_path).mkdir(parents=True, exist_ok=True)
 
-    config_path = join(config_path, CONFIG_INI_NAME)
-
-    with open(config_path, mode='w', encoding='utf-8') as configfile:
-        config.write(configfile)
+    write_ini_file(join(config_path, CONFIG_INI_NAME), config)
 
-    forbid_updates_for(run_config.path_to_app)
+    product_info = get_product_info(run_config.path_to_app)
+    forbid_updates_for(run_config.path_to_app, product_info)
 
     if run_config.use_separate_config:
-        create_idea_properties_file(run_config)
+        create_idea_properties_file(run_config, product_info)
 
-    generate_run_script(run_config)
+    generate_run_script(run_config, product_info)
 
     if run_config.is_secure():
         generate_server_secrets(run_config)
@@ -3,12 +3,13 @@
 #  in the LICENSE file.
 
 """Projector defaults related stuff"""
-import configparser
 from dataclasses import dataclass
-from os.path import join, isfile
+from functools import lru_cache
+from os.path import join
 from typing import Optional, ClassVar
 
 from projector_installer.global_config import config_dir
+from projector_installer.utils import write_ini_file
 
 DEFAULTS_INI = 'defaults.ini'
 
@@ -37,22 +38,26 @@ def get_path_to_defaults() -> str:
 
 def get_defaults() -> Defaults:
     """Read default settings"""
-    parser = configparser.ConfigParser(strict=False, interpolation=None)
-    defaults_path = get_path_to_defaults()
+    return Defaults(read_default_host())
+
+
+@lru_cache(maxsize=1)
+def read_default_host() -> str:
+    """Reads default host from defaults file, the file is read once per process"""
+    import configparser  # pylint: disable=import-outside-toplevel
 
-    if not isfile(defaults_path):
-        return Defaults()
+    parser = configparser.ConfigParser(strict=False, interpolation=None)
 
-    parser.read(defaults_path)
+    try:
+        with open(get_path_to_defaults(), mode='r', encoding='utf-8') as file:
+            parser.read_file(file)
+    except FileNotFoundError:
+        return ''
 
-    return Defaults(parser.get('PROJECTOR', 'HOST', fallback=''))
+    return parser.get('PROJECTOR', 'HOST', fallback='')
 
 
 def save_defaults(defaults: Defaults) -> None:
     """Save projector defaults file"""
-    parser = configparser.ConfigParser(strict=False, interpolation=None)
-    parser['PROJECTOR'] = {}
-    parser['PROJECTOR']['HOST'] = defaults.host
-
-    with open(get_path_to_defaults(), mode='w', encoding='utf-8') as file:
-        parser.write(file)
+    write_ini_file(get_path_to_defaults(), {'PROJECTOR': {'HOST': defaults.host}})
+    read_default_host.cache_clear()
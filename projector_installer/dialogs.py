@@ -8,10 +8,11 @@ import platform
 import sys
 import readline
 from enum import Enum, auto
+from functools import lru_cache
 from getpass import getpass
 
 from os.path import expanduser
-from typing import Optional, Dict, List, Tuple, TypeVar, Callable
+from typing import Optional, Dict, List, Set, FrozenSet, Tuple, TypeVar, Callable
 
 import click
 from click import INT
@@ -25,6 +26,7 @@ from .utils import get_local_addresses, generate_random_password
 from .products import get_compatible_apps, IDEKind, Product, get_all_apps
 
 DEF_PROJECTOR_PORT: int = 9999
+TCP_LISTEN_STATE = b'0A'  # state column value of listening socket in /proc/net/tcp
 
 
 def get_compatible_app_names(kind: IDEKind, pattern: Optional[str] = None) -> List[Product]:
@@ -35,8 +37,7 @@ def get_compatible_app_names(kind: IDEKind, pattern: Optional[str] = None) -> Li
 
 def display_run_configs_names(config_names: List[str]) -> None:
     """Pretty-print config names."""
-    for i, config_name in enumerate(config_names):
-        print(f'\t{i + 1:4}. {config_name}')
+    print_selection_list(config_names)
 
 
 def list_configs(pattern: Optional[str] = None) -> None:
@@ -45,17 +46,10 @@ def list_configs(pattern: Optional[str] = None) -> None:
     display_run_configs_names(config_names)
 
 
-def display_run_configs(run_configs: Dict[str, RunConfig]) -> None:
-    """Display sorted names of given run configs."""
-    config_names = list(run_configs.keys())
-    config_names.sort()
-    display_run_configs_names(config_names)
-
-
 def print_selection_list(names: List[str]) -> None:
     """Pretty list for selection."""
-    for i, name in enumerate(names):
-        print(f'\t{i + 1:4}. {name}')
+    if names:
+        print('\n'.join(f'\t{i + 1:4}. {name}' for i, name in enumerate(names)))
 
 
 def list_apps(pattern: Optional[str]) -> None:
@@ -212,13 +206,17 @@ def select_run_config(config_name: Optional[str]) -> RunConfig:
         print(f'Configuration with name {config_name} is unknown, exiting...')
         sys.exit(1)
 
-    if len(run_configs) > 1:
+    configs_count = len(run_configs)
+
+    if configs_count > 1:
+        prompt = f'Choose a configuration number or 0 to exit: [0-{configs_count}]'
+        config_names = sorted(run_configs)
+
         while True:
-            display_run_configs(run_configs)
-            prompt = f'Choose a configuration number or 0 to exit: [0-{len(run_configs)}]'
+            display_run_configs_names(config_names)
             config_number = click.prompt(prompt, type=INT)
 
-            if config_number < 0 or config_number > len(run_configs):
+            if config_number < 0 or config_number > configs_count:
                 print('Invalid number selected.')
                 continue
 
@@ -226,7 +224,6 @@ def select_run_config(config_name: Optional[str]) -> RunConfig:
                 print('Configuration was not selected, exiting...')
                 sys.exit(1)
             else:
-                config_names = get_run_config_names(config_name)
                 name = config_names[config_number - 1]
                 return run_configs[name]
 
@@ -367,46 +364,37 @@ def select_app_path() -> Tuple[bool, Optional[str]]:
     return is_toolbox, app_path
 
 
-def get_all_listening_ports() -> List[int]:
+def get_all_listening_ports() -> Set[int]:
     """
     Returns all tcp port numbers in LISTEN state (on any address).
     Reads port state from /proc/net/tcp.
     """
-    res: List[int] = []
+    res: Set[int] = set()
 
     if platform.system() != 'Linux':
         return res
 
-    with open('/proc/net/tcp', mode='r', encoding='utf-8') as file:
-        try:
-            next(file)
-            for line in file:
-                split_line = line.strip().split(' ')
-                hex_port = split_line[1].split(':')[1]
-                hex_state = split_line[3]
-
-                if hex_state == '0A':
-                    res.append(int(hex_port, 16))
-        except StopIteration:
-            pass
+    with open('/proc/net/tcp', mode='rb') as file:
+        lines = file.read().splitlines()
 
-    return res
+    for line in lines[1:]:  # skip header
+        # sl local_address rem_address st ...
+        split_line = line.split(None, 4)
+        hex_state = split_line[3]
 
+        if hex_state == TCP_LISTEN_STATE:
+            hex_port = split_line[1].split(b':')[1]
+            res.add(int(hex_port, 16))
 
-def is_open_port(port: int) -> bool:
-    """ Checks if tcp port is LISTEN state in system."""
-    return port in get_all_listening_ports()
+    return res
 
 
 def get_def_port(ports: List[int], default: int) -> int:
     """Returns default or first unused in system and in run configs port."""
-    port = default
-
-    if len(ports) > 0:
-        ports.sort()
-        port = ports[-1] + 1
+    port = max(ports) + 1 if ports else default
+    listening_ports = get_all_listening_ports()
 
-    while is_open_port(port):
+    while port in listening_ports:
         port += 1
 
     return port
@@ -418,14 +406,24 @@ def get_def_projector_port() -> int:
     return get_def_port(ports, DEF_PROJECTOR_PORT)
 
 
+# Addresses which are acceptable on any host
+WELL_KNOWN_ADDRESSES = ['localhost', '0.0.0.0']
+
+
 def get_all_addresses() -> List[str]:
     """Returns list of acceptable ip addresses."""
-    return ['localhost', '0.0.0.0'] + get_local_addresses()
+    return WELL_KNOWN_ADDRESSES + get_local_addresses()
+
+
+@lru_cache(maxsize=1)
+def get_acceptable_addresses() -> FrozenSet[str]:
+    """Returns set of acceptable ip addresses."""
+    return frozenset(get_all_addresses())
 
 
 def check_listening_address(address: str) -> bool:
     """Check entered ip address for validity."""
-    return address in get_all_addresses()
+    return address in WELL_KNOWN_ADDRESSES or address in get_acceptable_addresses()
 
 
 def select_projector_port() -> int:
@@ -8,8 +8,9 @@ Global configuration constants, variables and functions.
 """
 
 import sys
+from functools import lru_cache
 from shutil import rmtree
-from os.path import dirname, join, expanduser, abspath
+from os.path import dirname, join, expanduser, abspath, isdir
 
 from .utils import create_dir_if_not_exist
 
@@ -24,6 +25,7 @@ cache_dir: str = ''
 CHANGELOG_URL = 'https://github.com/JetBrains/projector-installer/blob/master/CHANGELOG.md'
 LONG_NETWORK_TIMEOUT = 3.0
 SHORT_NETWORK_TIMEOUT = 0.2
+UPDATE_CHECK_FILE = 'update_check.json'
 
 
 def get_changelog_url(ver: str) -> str:
@@ -66,11 +68,22 @@ def get_ssl_dir() -> str:
     return join(config_dir, 'ssl')
 
 
+def get_update_check_file() -> str:
+    """Returns full path to file with cached result of projector-installer update check"""
+    return join(config_dir, UPDATE_CHECK_FILE)
+
+
 def get_projector_server_dir() -> str:
     """Returns directory with projector server jar"""
     return join(INSTALL_DIR, BUNDLED_DIR, SERVER_DIR)
 
 
+@lru_cache(maxsize=1)
+def is_config_dir_exist(directory: str) -> bool:
+    """Checks if given config directory exists"""
+    return isdir(directory)
+
+
 def init_cache_dir() -> None:
     """Initialize download cache dir"""
     create_dir_if_not_exist(get_download_cache_dir())
@@ -84,6 +97,7 @@ def init_config_dir() -> None:
         create_dir_if_not_exist(get_apps_dir())
         create_dir_if_not_exist(get_run_configs_dir())
         init_cache_dir()
+        is_config_dir_exist.cache_clear()
     except Exception as exception:
         print(f'Error during initialization: {str(exception)}, cleanup ...')
         rmtree(config_dir)
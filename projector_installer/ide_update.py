@@ -3,8 +3,7 @@
 #  in the LICENSE file.
 
 """IDE update stuff"""
-from distutils.version import LooseVersion
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import click
 
 from .config_generator import save_config
@@ -14,6 +13,7 @@ from .products import Product, get_product_releases, IDEKind, load_compatible_ap
 from .apps import is_projector_installed_ide, get_product_info, download_and_install, ProductInfo
 from .run_config import RunConfig
 from .timeout import TimeoutException, timeout
+from .utils import get_version_key
 
 # This map differs from products.CODE2KIND in several positions.
 IDE_UPDATE_CODE2KIND = {
@@ -42,13 +42,13 @@ def get_product_list_from_file(kind: IDEKind) -> List[Product]:
     return [prod for prod in load_compatible_apps(COMPATIBLE_IDE_FILE) if prod.kind == kind]
 
 
-def is_tested_ide(run_config: RunConfig) -> bool:
+def is_tested_ide(run_config: RunConfig, prod_info: Optional[ProductInfo] = None) -> bool:
     """Returns True if given IDE is from compatible list"""
 
     if run_config.update_channel == RunConfig.UNKNOWN:
-        prod_info = get_product_info(run_config.path_to_app)
+        prod_info = prod_info or get_product_info(run_config.path_to_app)
         kind: IDEKind = IDE_UPDATE_CODE2KIND.get(prod_info.product_code, IDEKind.Unknown)
-        ver = LooseVersion(prod_info.version)
+        ver = get_version_key(prod_info.version)
 
         for prod in load_compatible_apps(COMPATIBLE_IDE_FILE):
             if prod.kind == kind and prod.ver == ver:
@@ -59,14 +59,14 @@ def is_tested_ide(run_config: RunConfig) -> bool:
     return run_config.update_channel == RunConfig.TESTED
 
 
-def get_product_version(prod_info: ProductInfo) -> LooseVersion:
+def get_product_version(prod_info: ProductInfo) -> Tuple[int, ...]:
     """"Return version for given product"""
     kind: IDEKind = IDE_UPDATE_CODE2KIND.get(prod_info.product_code, IDEKind.Unknown)
 
     if kind in EAP_PRODUCTS:
-        return LooseVersion(f'{prod_info.version}.{prod_info.build_number}')
+        return get_version_key(f'{prod_info.version}.{prod_info.build_number}')
 
-    return LooseVersion(prod_info.version)
+    return get_version_key(prod_info.version)
 
 
 def get_update(run_config: RunConfig) -> Optional[Product]:
@@ -79,8 +79,8 @@ def get_update(run_config: RunConfig) -> Optional[Product]:
 
     current = get_product_version(prod_info)
 
-    prod_list = get_product_list_from_file(kind) \
-        if is_tested_ide(run_config) else get_product_releases(kind, timeout=LONG_NETWORK_TIMEOUT)
+    prod_list = get_product_list_from_file(kind) if is_tested_ide(run_config, prod_info) \
+        else get_product_releases(kind, timeout=LONG_NETWORK_TIMEOUT)
 
     product = None
 
@@ -3,7 +3,6 @@
 #  in the LICENSE file.
 
 """Product class and related stuff"""
-import json
 import socket
 from os import remove
 from os.path import join, dirname, abspath
@@ -11,11 +10,11 @@ from tempfile import gettempdir
 from typing import List, Tuple, Any, Optional
 from enum import Enum, auto
 from urllib.error import URLError
-from distutils.version import LooseVersion
 from dataclasses import dataclass
 
 from .global_config import LONG_NETWORK_TIMEOUT
-from .utils import download_file, get_file_name_from_url, get_json
+from .utils import download_file, get_file_name_from_url, get_json, json_loads, \
+    get_version_key
 
 COMPATIBLE_IDE_FILE: str = join(dirname(abspath(__file__)), 'compatible_ide.json')
 
@@ -50,7 +49,7 @@ class Product:
     name: str
     url: str
     kind: IDEKind
-    ver: LooseVersion = LooseVersion('0.0.0')
+    ver: Tuple[int, ...] = (0, 0, 0)
 
     def __key__(self) -> Tuple[str, str]:
         return self.name, self.url
@@ -82,15 +81,15 @@ def _parse_entry(entry: Any) -> Product:
     except KeyError:
         kind = IDEKind.Unknown
 
-    ver = LooseVersion(entry['name'].split(' ')[-1])
+    ver = get_version_key(entry['name'].split(' ')[-1])
 
     return Product(entry['name'], entry['url'], kind, ver)
 
 
 def load_installable_apps_from_file(file_name: str) -> List[Product]:
     """Loads installable app list from json file."""
-    with open(file_name, mode='r', encoding='utf-8') as file:
-        data = json.load(file)
+    with open(file_name, mode='rb') as file:
+        data = json_loads(file.read())
 
     return [_parse_entry(entry) for entry in data]
 
@@ -149,7 +148,7 @@ KIND2CODE = {
 CODE2KIND = {code: kind for kind, code in KIND2CODE.items()}
 
 # All releases before this version considered as unsupported
-EARLIEST_COMPATIBLE_VERSION = LooseVersion('2020.1')
+EARLIEST_COMPATIBLE_VERSION = (2020, 1)
 
 
 def get_all_product_codes() -> str:
@@ -198,7 +197,7 @@ def get_product_releases(kind: Optional[IDEKind], timeout: float) -> List[Produc
                 build = release['build']
                 ver = f'{ver}.{build}'
 
-            if LooseVersion(ver) < EARLIEST_COMPATIBLE_VERSION:
+            if get_version_key(ver) < EARLIEST_COMPATIBLE_VERSION:
                 continue
 
             downloads = release['downloads']
@@ -223,12 +222,12 @@ def filter_app_by_name_pattern(data: List[Product], pattern: Optional[str] = Non
     """Filters given Product list by given name pattern.
     Returns list with single element on exact match."""
 
-    apps = [app for app in data
-            if pattern is None or app.name.lower().find(pattern.lower()) != -1]
+    lower_pattern = pattern.lower() if pattern else ''
+    apps = [app for app in data if lower_pattern in app.name.lower()]
 
-    if pattern:
+    if lower_pattern:
         for app in apps:
-            if pattern.lower() == app.name.lower():
+            if lower_pattern == app.name.lower():
                 return [app]
 
     return apps
@@ -3,22 +3,31 @@
 #  in the LICENSE file.
 
 """Check updates module"""
-from distutils.version import LooseVersion
+import atexit
+import json
+import os
 import socket
+from functools import lru_cache
 from os import environ
-from typing import Optional, Any
-from urllib.error import URLError
+from queue import Queue, Empty
+from threading import Thread
+from time import time as current_time
+from typing import Optional, Any, Dict
+from urllib.error import URLError, HTTPError
+from urllib.request import Request, urlopen
 import click
 
 from .global_config import get_changelog_url, LONG_NETWORK_TIMEOUT, \
-    SHORT_NETWORK_TIMEOUT, INSTALL_DIR, USER_HOME
+    SHORT_NETWORK_TIMEOUT, INSTALL_DIR, USER_HOME, get_update_check_file
 
-from .timeout import timeout, TimeoutException
-from .utils import get_json, is_in_venv
+from .utils import get_json, is_in_venv, get_version_key, json_loads
 
 from .version import __version__
 
 PYPI_PRODUCT_URL = 'https://pypi.org/pypi/projector-installer/json'
+UPDATE_CHECK_INTERVAL = 24 * 60 * 60  # seconds
+FAILED_UPDATE_CHECK_INTERVAL = 60 * 60  # seconds
+STALE_FILE_AGE = 60  # seconds
 
 
 def print_self_update_warning() -> None:
@@ -35,6 +44,7 @@ except ModuleNotFoundError:
     print_self_update_warning()
 
 
+@lru_cache(maxsize=2)
 def get_latest_installer_version(time: float) -> Optional[Any]:
     """Retrieve projector-installer version from pypi with given timeout"""
     try:
@@ -49,9 +59,10 @@ def is_newer_than_current(ver_to_check: str) -> bool:
     Compares given version with current.
     Returns True if given version is more recent
     """
-    current_version = LooseVersion(__version__)
-    pypi_version = LooseVersion(ver_to_check)
-    return current_version < pypi_version
+    if ver_to_check == __version__:  # the usual case, no need to parse versions
+        return False
+
+    return get_version_key(__version__) < get_version_key(ver_to_check)
 
 
 def is_update_available() -> bool:
@@ -69,31 +80,154 @@ def is_update_available() -> bool:
 UPDATE_COMMAND = 'projector self-update'
 
 
-@timeout(SHORT_NETWORK_TIMEOUT)
-def get_latest_version_fast() -> Optional[Any]:
-    """Decorated for fast check"""
-    return get_latest_installer_version(LONG_NETWORK_TIMEOUT)
+def load_update_check() -> Dict[str, Any]:
+    """Returns result of previous update check, or empty dict if there is none"""
+    try:
+        with open(get_update_check_file(), mode='rb') as file:
+            data = json_loads(file.read())
+    except (OSError, ValueError):
+        return {}
+
+    return data if isinstance(data, dict) else {}
 
 
-def check_for_projector_updates() -> None:
-    """Check if new projector version is available"""
+def get_recent_version(update_check: Dict[str, Any]) -> Optional[str]:
+    """Returns pypi version from given update check result if the check is recent enough"""
+    interval = FAILED_UPDATE_CHECK_INTERVAL if update_check.get('failed') \
+        else UPDATE_CHECK_INTERVAL
 
     try:
-        pypi_version = get_latest_version_fast()
-    except TimeoutException:
-        click.echo('Checking for updates ... ', nl=False)
-        pypi_version = get_latest_installer_version(LONG_NETWORK_TIMEOUT)
-        click.echo('done.')
+        if 0 <= current_time() - update_check['checked_at'] < interval:
+            return str(update_check['version'])
+    except (KeyError, TypeError):
+        pass
+
+    return None
 
-    if pypi_version is None:
+
+def save_update_check(version: str, last_modified: str = '', failed: bool = False) -> None:
+    """Saves result of update check, if config directory already exists"""
+    file_name = get_update_check_file()
+    tmp_file_name = f'{file_name}.tmp'
+    data = {'version': version, 'last_modified': last_modified, 'checked_at': current_time(),
+            'failed': failed}
+
+    try:
+        # O_EXCL: if another projector process is saving the result right now, let it win
+        fd = os.open(tmp_file_name, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    except FileExistsError:
+        remove_stale_file(tmp_file_name)
         return
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, mode='w', encoding='utf-8') as file:
+            json.dump(data, file)
 
+        os.replace(tmp_file_name, file_name)
+    except OSError:
+        remove_stale_file(tmp_file_name, 0)
+
+
+def remove_stale_file(file_name: str, max_age: float = STALE_FILE_AGE) -> None:
+    """Removes file left by interrupted process, if it is older than given age in seconds"""
+    try:
+        if current_time() - os.stat(file_name).st_mtime >= max_age:
+            os.remove(file_name)
+    except OSError:
+        pass
+
+
+def get_modified_installer_version(time: float, update_check: Dict[str, Any]) -> Optional[str]:
+    """
+    Retrieve projector-installer version from pypi with given timeout.
+    Pypi is asked to skip the response body if it was not modified since previous check.
+    """
+    cached_version = update_check.get('version')
+    last_modified = update_check.get('last_modified')
+    headers = {'If-Modified-Since': last_modified} if cached_version and last_modified else {}
+
+    try:
+        with urlopen(Request(PYPI_PRODUCT_URL, headers=headers), timeout=time) as resp:
+            version = str(json_loads(resp.read())['info']['version'])
+            save_update_check(version, resp.headers.get('Last-Modified', ''))
+            return version
+    except HTTPError as error:
+        if error.code == 304 and headers:
+            save_update_check(str(cached_version), str(last_modified))
+            return str(cached_version)
+
+        return None
+    except (URLError, socket.timeout, ConnectionError, ValueError, KeyError):
+        return None
+
+
+@lru_cache(maxsize=4)
+def get_update_message(pypi_version: str) -> str:
+    """Returns styled message about available projector-installer update"""
+    msg = '\n'.join([
+        '',
+        f'New version {pypi_version} of projector-installer is available '
+        f'(ver. {__version__} is installed)!',
+        f'Changelog: {get_changelog_url(pypi_version)}',
+        f'To update use command: {UPDATE_COMMAND}',
+        ''
+    ])
+    return click.style(msg, bold=True)
+
+
+def print_update_message(pypi_version: str) -> None:
+    """Prints message if given pypi version is newer than installed one"""
     if is_newer_than_current(pypi_version):
-        msg = f'\nNew version {pypi_version} of projector-installer is available ' \
-              f'(ver. {__version__} is installed)!\n' \
-              f'Changelog: {get_changelog_url(pypi_version)}\n' \
-              f'To update use command: {UPDATE_COMMAND}\n'
-        click.secho(msg, bold=True)
+        click.echo(get_update_message(pypi_version))
+
+
+def fetch_latest_version(update_check: Dict[str, Any], results: 'Queue[str]') -> None:
+    """Retrieves pypi version and puts it to given queue, runs in background thread"""
+    pypi_version = get_modified_installer_version(LONG_NETWORK_TIMEOUT, update_check)
+
+    if pypi_version is not None:
+        results.put(pypi_version)
+        return
+
+    # Update message is purely informational: do not retry until failed check interval passes
+    cached_version = update_check.get('version')
+
+    if cached_version:
+        save_update_check(str(cached_version), str(update_check.get('last_modified', '')), True)
+    else:
+        save_update_check(__version__, failed=True)
+
+
+def print_update_message_when_ready(worker: Thread, results: 'Queue[str]') -> None:
+    """Waits a bit for background update check and prints its result, called at exit"""
+    worker.join(SHORT_NETWORK_TIMEOUT)
+
+    try:
+        print_update_message(results.get_nowait())
+    except Empty:
+        pass
+
+
+def check_for_projector_updates() -> None:
+    """
+    Check if new projector version is available.
+    If there is no recent check result, pypi is queried in background
+    and the message is printed at exit.
+    """
+
+    update_check = load_update_check()
+    pypi_version = get_recent_version(update_check)
+
+    if pypi_version is not None:
+        print_update_message(pypi_version)
+        return
+
+    results: 'Queue[str]' = Queue()
+    worker = Thread(target=fetch_latest_version, args=(update_check, results), daemon=True)
+    worker.start()
+    atexit.register(print_update_message_when_ready, worker, results)
 
 
 def is_user_install() -> bool:
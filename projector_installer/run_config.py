@@ -5,7 +5,7 @@
 
 """Run configurations related functions"""
 import shutil
-from os import listdir, rename
+from os import scandir, rename
 from os.path import join, isdir, basename, isfile
 from shutil import rmtree
 from typing import Optional, Dict, List, TextIO, ClassVar
@@ -179,10 +179,14 @@ def get_run_configs(pattern: Optional[str] = None) -> Dict[str, RunConfig]:
 
     res = {}
 
-    for config_name in listdir(run_configs_dir):
-        if pattern and config_name.lower().find(pattern.lower()) == -1:
-            continue
+    with scandir(run_configs_dir) as entries:
+        config_names = [entry.name for entry in entries if entry.is_dir()]
+
+    if pattern:
+        lower_pattern = pattern.lower()
+        config_names = [name for name in config_names if lower_pattern in name.lower()]
 
+    for config_name in config_names:
         if not is_run_config_name(config_name):
             continue
 
@@ -7,27 +7,36 @@
 Misc utility functions.
 """
 import os
+import re
 import platform
 import stat
 import sys
 import io
-import json
 import tarfile
 import zipfile
 import subprocess
 import secrets
+import socket
 import string
 from os import listdir, remove, makedirs, chmod
 
-from os.path import join, isfile, getsize, basename, isdir, realpath, expandvars, expanduser
+from os.path import join, isfile, getsize, basename, isdir, realpath, expandvars, expanduser, \
+    abspath
+from functools import lru_cache
 from shutil import copy
 from urllib.parse import ParseResult, urlparse
 from urllib.request import urlopen
-from typing import Optional, BinaryIO, cast, List, Any
+from typing import Optional, BinaryIO, cast, List, Any, Tuple, Dict
 
 import netifaces  # type: ignore
 from click import progressbar, echo
 
+try:
+    # orjson is optional: it parses JSON documents several times faster than json
+    from orjson import loads as json_loads
+except ModuleNotFoundError:
+    from json import loads as json_loads  # type: ignore
+
 CHUNK_SIZE = 4 * 1024 * 1024
 PROGRESS_BAR_WIDTH = 50
 PROGRESS_BAR_TEMPLATE = '[%(bar)s]  %(info)s'
@@ -176,37 +185,47 @@ def is_inside_docker() -> bool:
     return isfile('/.dockerenv')
 
 
-def is_docker_interface(ifs: Any) -> bool:
-    """Returns True if given interface belongs to docker"""
-    addresses = netifaces.ifaddresses(ifs)
+def is_docker_interface(macs: List[str]) -> bool:
+    """Returns True if interface with given MAC addresses belongs to docker"""
+    return any(mac[:5] == DOCKER_VENDOR for mac in macs)
 
-    if netifaces.AF_LINK in addresses:
-        for mac in addresses[netifaces.AF_LINK]:
-            if mac['addr'][:5] == DOCKER_VENDOR:
-                return True
 
-    return False
+def get_interfaces_addresses() -> List[Tuple[List[str], List[str]]]:
+    """Returns MAC and IPv4 addresses of every network interface"""
+    try:
+        # psutil is optional: it returns addresses of all interfaces with a single getifaddrs call,
+        # netifaces calls getifaddrs once per interface
+        # pylint: disable=import-outside-toplevel
+        from psutil import net_if_addrs, AF_LINK  # type: ignore
+    except ModuleNotFoundError:
+        res = []
 
+        for ifs in netifaces.interfaces():
+            addresses = netifaces.ifaddresses(ifs)
+            res.append(([mac['addr'] for mac in addresses.get(netifaces.AF_LINK, ())],
+                        [ips['addr'] for ips in addresses.get(netifaces.AF_INET, ())]))
 
-def get_local_addresses() -> List[str]:
-    """Returns list of local ip addresses."""
-    interfaces = netifaces.interfaces()
-    res = []
+        return res
 
-    for ifs in interfaces:
+    return [([addr.address for addr in addrs if addr.family == AF_LINK],
+             [addr.address for addr in addrs if addr.family == socket.AF_INET])
+            for addrs in net_if_addrs().values()]
 
-        if not is_inside_docker() and is_docker_interface(ifs):
-            continue
 
-        addresses = netifaces.ifaddresses(ifs)
+@lru_cache(maxsize=1)
+def read_local_addresses() -> Tuple[str, ...]:
+    """Returns local ip addresses, interfaces are scanned once per process."""
+    skip_docker = not is_inside_docker()
 
-        if netifaces.AF_INET in addresses:
-            ipv4 = addresses[netifaces.AF_INET]
+    return tuple(address
+                 for macs, addresses in get_interfaces_addresses()
+                 if not (skip_docker and is_docker_interface(macs))
+                 for address in addresses)
 
-            for ips in ipv4:
-                res.append(ips['addr'])
 
-    return res
+def get_local_addresses() -> List[str]:
+    """Returns list of local ip addresses."""
+    return list(read_local_addresses())
 
 
 def get_json(url: str, timeout: float) -> Any:
@@ -217,7 +236,7 @@ def get_json(url: str, timeout: float) -> Any:
     if code != 200:
         raise IOError(f'HTTP error code: {code}')
 
-    return json.loads(resp.read().decode())
+    return json_loads(resp.read())
 
 
 def generate_token(length: int = DEF_TOKEN_LEN) -> str:
@@ -251,11 +270,34 @@ def get_distributive_name() -> str:
     return ''
 
 
+@lru_cache(maxsize=64)
 def expand_path(path: str) -> str:
     """Performs full path expansion"""
     return realpath(expandvars(expanduser(path)))
 
 
+def write_ini_file(file_name: str, sections: Dict[str, Dict[str, str]]) -> None:
+    """Writes given sections to ini file in the same format as configparser does"""
+    parts = []
+
+    for section, options in sections.items():
+        parts.append(f'[{section}]\n')
+
+        for key, value in options.items():
+            value = value.replace('\n', '\n\t')
+            parts.append(f'{key.lower()} = {value}\n')
+
+        parts.append('\n')
+
+    with open(file_name, mode='w', encoding='utf-8') as file:
+        file.write(''.join(parts))
+
+
+def expand_path_lazy(path: str) -> str:
+    """Performs path expansion without resolving symlinks"""
+    return abspath(expandvars(expanduser(path)))
+
+
 def is_in_venv() -> bool:
     """Check if process run in Python virtual environment"""
 
@@ -266,6 +308,16 @@ def is_in_venv() -> bool:
     return get_base_prefix() != sys.prefix
 
 
+@lru_cache(maxsize=1)
 def is_linux_x86_64() -> bool:
     """Returns true for Linux x86_64 machine"""
     return platform.system() == 'Linux' and platform.machine() == 'x86_64'
+
+
+VERSION_PART_PATTERN = re.compile(r'\d+')
+
+
+@lru_cache(maxsize=256)
+def get_version_key(version: str) -> Tuple[int, ...]:
+    """Returns comparable key for given version string: tuple of its numeric parts"""
+    return tuple(int(part) for part in VERSION_PART_PATTERN.findall(version))
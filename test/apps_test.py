@@ -1,10 +1,16 @@
 """Test apps.py module"""
+import json
+import os
 from unittest import TestCase
+from unittest import mock
 from os.path import join, expanduser
+from tempfile import TemporaryDirectory
 import pytest
 
 from projector_installer.apps import get_app_path, is_path_to_app, parse_version, \
-    get_data_dir_from_script, is_mps_dir, VersionFormatError
+    get_data_dir_from_script, is_mps_dir, VersionFormatError, get_product_info, PRODUCT_INFO, \
+    PRODUCT_INFO_CACHE, contains_line, append_line, get_path_to_toolbox_channel, \
+    get_toolbox_channel_re
 
 
 class AppsTest(TestCase):
@@ -79,6 +85,47 @@ class AppsTest(TestCase):
         self.assertEqual(parsed.quart, 0)
         self.assertEqual(parsed.last, -1)
 
+    def test_get_product_info_data_dir(self) -> None:
+        """
+        The get_product_info method must take data dir from product-info.json if it is present
+        """
+        data = {'name': 'IDE', 'version': '2021.1', 'buildNumber': '211.1',
+                'productCode': 'IC', 'svgIconPath': 'bin/idea.svg',
+                'dataDirectoryName': 'IDE2021.1',
+                'launch': [{'os': 'Linux', 'launcherPath': 'bin/idea.sh',
+                            'vmOptionsFilePath': 'bin/idea64.vmoptions',
+                            'startupWmClass': 'jetbrains-idea'}]}
+
+        with TemporaryDirectory() as app_path:
+            with open(join(app_path, PRODUCT_INFO), mode='w', encoding='utf-8') as file:
+                json.dump(data, file)
+
+            self.assertEqual(get_product_info(app_path).data_dir, 'IDE2021.1')
+
+    def test_contains_line(self) -> None:
+        """
+        The contains_line method must return true only if the whole line is present in the text
+        """
+        self.assertTrue(contains_line(b'first\nsecond\n', b'second'))
+        self.assertTrue(contains_line(b'first', b'first'))
+        self.assertFalse(contains_line(b'first_second\n', b'second'))
+
+    def test_append_line(self) -> None:
+        """
+        The append_line method must add the line once, on its own line
+        """
+        with TemporaryDirectory() as tmp_dir:
+            file_name = join(tmp_dir, 'idea.properties')
+
+            with open(file_name, 'w', encoding='utf-8') as file:
+                file.write('first')
+
+            append_line(file_name, 'second')
+            append_line(file_name, 'second')
+
+            with open(file_name, 'r', encoding='utf-8') as file:
+                self.assertEqual(file.read(), 'first\nsecond\n')
+
     def test_get_data_dir_from_script_raises_exception(self) -> None:
         """
         The get_data_dir_from_script method must raise an exception
@@ -87,9 +134,81 @@ class AppsTest(TestCase):
         with pytest.raises(FileNotFoundError):
             get_data_dir_from_script("incorrect_run_script")
 
+    def test_get_data_dir_from_script(self) -> None:
+        """
+        The get_data_dir_from_script method must return the value of idea.paths.selector
+        property from the run script
+        """
+        with TemporaryDirectory() as tmp_dir:
+            run_script = join(tmp_dir, 'idea.sh')
+
+            with open(run_script, mode='w', encoding='utf-8') as file:
+                file.write('#!/bin/sh\n'
+                           '  -Didea.paths.selector=IdeaIC2019.3 \\\n'
+                           '  com.intellij.idea.Main\n')
+
+            self.assertEqual(get_data_dir_from_script(run_script), 'IdeaIC2019.3')
+
     def test_is_mps_dir_false(self) -> None:
         """
         The is_mps_dir method must return false
         if it gets incorrect mps dir as input
         """
         self.assertFalse(is_mps_dir("is_not_mps_dir"))
+
+    def test_get_product_info_reloads_changed_file(self) -> None:
+        """
+        The get_product_info method must return cached product info
+        until product-info.json is changed
+        """
+        data = {'name': 'IDE', 'version': '2021.2', 'buildNumber': '212.1',
+                'productCode': 'IC', 'svgIconPath': 'bin/idea.svg',
+                'dataDirectoryName': 'IDE2021.2',
+                'launch': [{'os': 'Linux', 'launcherPath': 'bin/idea.sh',
+                            'vmOptionsFilePath': 'bin/idea64.vmoptions',
+                            'startupWmClass': 'jetbrains-idea'}]}
+
+        with TemporaryDirectory() as app_path:
+            prod_info_path = join(app_path, PRODUCT_INFO)
+
+            with open(prod_info_path, mode='w', encoding='utf-8') as file:
+                json.dump(data, file)
+
+            self.assertIs(get_product_info(app_path), get_product_info(app_path))
+
+            data['version'] = '2021.3'
+
+            with open(prod_info_path, mode='w', encoding='utf-8') as file:
+                json.dump(data, file)
+
+            stats = os.stat(prod_info_path)
+            os.utime(prod_info_path, ns=(stats.st_atime_ns, stats.st_mtime_ns + 1))
+
+            self.assertEqual(get_product_info(app_path).version, '2021.3')
+            self.assertEqual(PRODUCT_INFO_CACHE[app_path][1].version, '2021.3')
+
+    def test_get_path_to_toolbox_channel(self) -> None:
+        """
+        The get_path_to_toolbox_channel method must return path to the first ch-N directory
+        inside toolbox apps directory, or None if there is no such directory
+        """
+        apps = '/toolbox/apps'
+        get_toolbox_channel_re.cache_clear()
+
+        try:
+            with mock.patch('projector_installer.apps.get_toolbox_apps_location',
+                            return_value=apps):
+                self.assertEqual(get_path_to_toolbox_channel(f'{apps}/x/ch-2/1'), f'{apps}/x/ch-2')
+                self.assertEqual(get_path_to_toolbox_channel(f'{apps}/x/ch-0'), f'{apps}/x/ch-0')
+                self.assertEqual(get_path_to_toolbox_channel(f'{apps}/x/y/ch-1/ch-3/211.1'),
+                                 f'{apps}/x/y/ch-1')
+                self.assertIsNone(get_path_to_toolbox_channel(f'{apps}/x/notch-1/1'))
+                self.assertIsNone(get_path_to_toolbox_channel('/other/ch-0'))
+
+            get_toolbox_channel_re.cache_clear()
+
+            with mock.patch('projector_installer.apps.get_toolbox_apps_location',
+                            return_value=''):
+                self.assertIsNone(get_path_to_toolbox_channel(f'{apps}/x/ch-2/1'))
+        finally:
+            get_toolbox_channel_re.cache_clear()
@@ -0,0 +1,54 @@
+"""Test cmd.py module"""
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from projector_installer.cmd import is_update_check_required, projector, ide, config, \
+    is_cwd_exist, is_read_only_command
+
+
+class CmdTest(TestCase):
+    """Test cmd.py module"""
+
+    def test_is_update_check_required(self) -> None:
+        """
+        The is_update_check_required method must return false for help and read-only commands
+        """
+        self.assertFalse(is_update_check_required(None, []))
+        self.assertTrue(is_update_check_required('config', ['config', 'run', 'name']))
+        self.assertFalse(is_update_check_required('config', ['config', 'list']))
+        self.assertFalse(is_update_check_required('find', ['find', 'idea']))
+        self.assertFalse(is_update_check_required('run', ['run', '--help']))
+        self.assertFalse(is_update_check_required('ide', ['--version', 'ide', 'install']))
+        self.assertFalse(is_update_check_required('self-update', ['self-update']))
+
+    def test_is_read_only_command(self) -> None:
+        """The is_read_only_command method must return true for help and listing commands only"""
+        self.assertFalse(is_read_only_command(None, []))
+        self.assertTrue(is_read_only_command('config', ['config', 'list']))
+        self.assertTrue(is_read_only_command('find', ['find', 'idea']))
+        self.assertTrue(is_read_only_command('run', ['run', '--help']))
+        self.assertFalse(is_read_only_command('config', ['config', 'run', 'name']))
+        self.assertFalse(is_read_only_command('self-update', ['self-update']))
+
+    def test_shortcut_commands(self) -> None:
+        """Shortcut commands must reuse the command objects of ide and config groups"""
+        self.assertIs(projector.commands['find'], ide.commands['find'])
+        self.assertIs(projector.commands['install'], ide.commands['install'])
+        self.assertIs(projector.commands['autoinstall'], ide.commands['autoinstall'])
+        self.assertIs(projector.commands['run'], config.commands['run'])
+        self.assertIs(projector.commands['ide'], ide)
+        self.assertIs(projector.commands['config'], config)
+
+    def test_is_cwd_exist(self) -> None:
+        """The is_cwd_exist method must return false if current directory was removed"""
+        cwd = os.getcwd()
+
+        try:
+            self.assertTrue(is_cwd_exist())
+
+            with TemporaryDirectory() as tmp_dir:
+                os.chdir(tmp_dir)
+
+            self.assertFalse(is_cwd_exist())
+        finally:
+            os.chdir(cwd)
@@ -1,7 +1,12 @@
 """Test config_generator.py module"""
+import io
+import os
+from os.path import join
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
-from projector_installer.config_generator import token_quote
+from projector_installer.config_generator import token_quote, write_run_script, open_executable
+from projector_installer.run_config import RunConfig
 
 
 class ConfigGeneratorTest(TestCase):
@@ -10,3 +15,60 @@ class ConfigGeneratorTest(TestCase):
     def test_token_quote(self) -> None:
         """The token_quote method must return the same token in quotes"""
         self.assertEqual(token_quote('some_token'), '\"some_token\"')
+
+    def test_write_run_script(self) -> None:
+        """The write_run_script method must replace only IDE specific lines of launch script"""
+        run_config = RunConfig('config', '/opt/app', False, 9999, '', '', '', False, '')
+        src = io.StringIO('#!/bin/sh\n'
+                          'IDE_BIN_HOME="${0%/*}"\n'
+                          '  -classpath "$CLASSPATH" \\\n'
+                          '  "${IDE_PROPERTIES_PROPERTY}" \\\n'
+                          '  com.intellij.idea.Main \\\n'
+                          '  "$@"\n')
+        dst = io.StringIO()
+        write_run_script(run_config, src, dst)
+        lines = dst.getvalue().splitlines()
+
+        self.assertEqual(lines[0], '#!/bin/sh')
+        self.assertEqual(lines[1], 'IDE_BIN_HOME=/opt/app/bin')
+        self.assertTrue(lines[2].startswith(' -classpath "$CLASSPATH:'))
+        self.assertEqual(lines[3], '  "${IDE_PROPERTIES_PROPERTY}" \\')
+        self.assertIn('classToLaunch=com.intellij.idea.Main', dst.getvalue())
+        self.assertEqual(lines[-1], '  "$@"')
+
+    def test_write_run_script_class_path(self) -> None:
+        """The write_run_script method must keep CLASS_PATH variable name of launch script"""
+        run_config = RunConfig('config', '/opt/app', False, 9999, '', '', '', False, '')
+        src = io.StringIO('  -classpath "$CLASS_PATH" \\\n')
+        dst = io.StringIO()
+        write_run_script(run_config, src, dst)
+
+        self.assertTrue(dst.getvalue().startswith(' -classpath "$CLASS_PATH:'))
+
+    def test_open_executable(self) -> None:
+        """The open_executable opener must create file with execute permission"""
+        with TemporaryDirectory() as tmp_dir:
+            file_name = join(tmp_dir, 'run.sh')
+
+            with open(file_name, mode='w', encoding='utf-8', opener=open_executable) as file:
+                file.write('#!/bin/sh\n')
+
+            self.assertTrue(os.access(file_name, os.X_OK))
+
+    def test_open_executable_existing_file(self) -> None:
+        """The open_executable opener must make existing file executable"""
+        with TemporaryDirectory() as tmp_dir:
+            file_name = join(tmp_dir, 'run.sh')
+
+            with open(file_name, mode='w', encoding='utf-8') as file:
+                file.write('old')
+
+            os.chmod(file_name, 0o644)
+
+            with open(file_name, mode='w', encoding='utf-8', opener=open_executable) as file:
+                file.write('#!/bin/sh\n')
+
+            self.assertEqual(os.stat(file_name).st_mode & 0o777, 0o755)
+
+            with open(file_name, mode='r', encoding='utf-8') as file:
+                self.assertEqual(file.read(), '#!/bin/sh\n')
@@ -1,4 +1,5 @@
 """Test dialogs.py module"""
+import io
 from unittest import TestCase
 from unittest import mock
 
@@ -6,7 +7,8 @@ import sys
 import pytest
 
 from projector_installer.dialogs import get_user_input, is_boolean_input, ask, \
-    prompt_with_default, get_all_listening_ports
+    prompt_with_default, get_all_listening_ports, get_def_port, \
+    print_selection_list, check_listening_address
 
 
 class DialogsTests(TestCase):
@@ -86,7 +88,52 @@ class DialogsTests(TestCase):
     @pytest.mark.skipif(sys.platform == "linux", reason="test for non-linux only")
     def test_get_all_listening_ports(self) -> None:
         """
-        The get_all_listening_ports method must return an empty array
+        The get_all_listening_ports method must return an empty set
         if the platform is not Linux
         """
-        self.assertEqual(get_all_listening_ports(), [])
+        self.assertEqual(get_all_listening_ports(), set())
+
+    def test_get_def_port(self) -> None:
+        """
+        The get_def_port method must return the port following the largest used one
+        and skip listening ports
+        """
+        with mock.patch('projector_installer.dialogs.get_all_listening_ports',
+                        return_value={10000, 10001}) as listening_ports:
+            ports = [9999, 9990]
+            self.assertEqual(get_def_port(ports, 9999), 10002)
+            self.assertEqual(ports, [9999, 9990])
+            self.assertEqual(get_def_port([], 9999), 9999)
+            self.assertEqual(listening_ports.call_count, 2)
+
+    def test_get_all_listening_ports_parse(self) -> None:
+        """The get_all_listening_ports method must return ports of LISTEN sockets only"""
+        proc_net_tcp = b'  sl  local_address rem_address   st tx_queue rx_queue\n' \
+                       b'   0: 00000000:270F 00000000:0000 0A 00000000:00000000\n' \
+                       b'   1: 0100007F:1F90 0100007F:9C40 01 00000000:00000000\n' \
+                       b'  10: 0100007F:0277 00000000:0000 0A 00000000:00000000\n'
+
+        with mock.patch('platform.system', return_value='Linux'), \
+                mock.patch('builtins.open', mock.mock_open(read_data=proc_net_tcp)):
+            self.assertEqual(get_all_listening_ports(), {9999, 631})
+
+    def test_print_selection_list(self) -> None:
+        """The print_selection_list method must print numbered names, one per line"""
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            print_selection_list([])
+            print_selection_list(['first', 'second'])
+
+        self.assertEqual(stdout.getvalue(), '\t   1. first\n\t   2. second\n')
+
+    def test_check_listening_address(self) -> None:
+        """
+        The check_listening_address method must accept well known addresses
+        without scanning network interfaces
+        """
+        with mock.patch('projector_installer.dialogs.get_acceptable_addresses',
+                        return_value=frozenset({'10.0.0.1'})) as acceptable_addresses:
+            self.assertTrue(check_listening_address('localhost'))
+            self.assertTrue(check_listening_address('0.0.0.0'))
+            acceptable_addresses.assert_not_called()
+            self.assertTrue(check_listening_address('10.0.0.1'))
+            self.assertFalse(check_listening_address('10.0.0.2'))
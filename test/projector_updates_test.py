@@ -1,7 +1,13 @@
 """Test projector_updates.py module"""
+from os.path import join
+from tempfile import TemporaryDirectory
+from time import time
 from unittest import TestCase
 
-from projector_installer.projector_updates import is_newer_than_current
+from projector_installer import global_config
+from projector_installer.global_config import get_update_check_file
+from projector_installer.projector_updates import is_newer_than_current, \
+    load_update_check, save_update_check, get_recent_version
 from projector_installer.version import __version__
 
 
@@ -27,3 +33,53 @@ class ProjectorUpdatesTest(TestCase):
     def test_is_newer_than_current_same_version(self) -> None:
         """The is_newer_than_current method must return false if the same version is provided"""
         self.assertFalse(is_newer_than_current(__version__))
+
+    def test_update_check(self) -> None:
+        """The load_update_check method must return result saved by save_update_check"""
+        saved_config_dir = global_config.config_dir
+
+        try:
+            with TemporaryDirectory() as tmp_dir:
+                global_config.config_dir = tmp_dir
+                self.assertEqual(load_update_check(), {})
+
+                save_update_check('1.2.3', 'Wed, 21 Oct 2015 07:28:00 GMT')
+                update_check = load_update_check()
+                self.assertEqual(update_check['last_modified'], 'Wed, 21 Oct 2015 07:28:00 GMT')
+                self.assertEqual(get_recent_version(update_check), '1.2.3')
+
+                global_config.config_dir = join(tmp_dir, 'missing')
+                save_update_check('1.2.3')
+                self.assertEqual(load_update_check(), {})
+        finally:
+            global_config.config_dir = saved_config_dir
+
+    def test_save_update_check_concurrent(self) -> None:
+        """The save_update_check method must not overwrite result being saved by other process"""
+        saved_config_dir = global_config.config_dir
+
+        try:
+            with TemporaryDirectory() as tmp_dir:
+                global_config.config_dir = tmp_dir
+
+                with open(f'{get_update_check_file()}.tmp', mode='w', encoding='utf-8'):
+                    pass
+
+                save_update_check('1.2.3')
+                self.assertEqual(load_update_check(), {})
+        finally:
+            global_config.config_dir = saved_config_dir
+
+    def test_get_recent_version_outdated(self) -> None:
+        """The get_recent_version method must return None for outdated update check"""
+        self.assertIsNone(get_recent_version({'version': '1.2.3', 'checked_at': 0}))
+
+    def test_get_recent_version_failed(self) -> None:
+        """The get_recent_version method must retry failed update check after a shorter interval"""
+        two_hours_ago = time() - 2 * 60 * 60
+        self.assertEqual(get_recent_version({'version': '1.2.3', 'checked_at': two_hours_ago}),
+                         '1.2.3')
+        self.assertIsNone(get_recent_version({'version': '1.2.3', 'checked_at': two_hours_ago,
+                                              'failed': True}))
+        self.assertEqual(get_recent_version({'version': '1.2.3', 'checked_at': time(),
+                                             'failed': True}), '1.2.3')
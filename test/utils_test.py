@@ -0,0 +1,45 @@
+"""Test utils.py module"""
+import socket
+import sys
+from collections import namedtuple
+from types import ModuleType
+from unittest import TestCase
+from unittest import mock
+
+from projector_installer.utils import read_local_addresses, get_version_key
+
+Address = namedtuple('Address', 'family address')
+
+
+class UtilsTest(TestCase):
+    """Test utils.py module"""
+
+    def test_get_version_key(self) -> None:
+        """
+        The get_version_key method must return comparable tuple of numeric version parts
+        """
+        self.assertEqual(get_version_key('2021.2.3'), (2021, 2, 3))
+        self.assertLess(get_version_key('2021.2.3'), get_version_key('2021.10'))
+
+    def test_read_local_addresses_psutil(self) -> None:
+        """
+        The read_local_addresses method must return IPv4 addresses reported by psutil
+        and skip docker interfaces
+        """
+        psutil = ModuleType('psutil')
+        psutil.AF_LINK = 17  # type: ignore
+        psutil.net_if_addrs = lambda: {  # type: ignore
+            'lo': [Address(socket.AF_INET, '127.0.0.1'), Address(17, '00:00:00:00:00:00')],
+            'docker0': [Address(socket.AF_INET, '172.17.0.1'), Address(17, '02:42:ac:11:00:01')],
+            'eth0': [Address(socket.AF_INET, '10.0.0.5'), Address(socket.AF_INET6, 'fe80::1'),
+                     Address(17, 'aa:bb:cc:dd:ee:ff')]
+        }
+
+        read_local_addresses.cache_clear()
+
+        try:
+            with mock.patch.dict(sys.modules, {'psutil': psutil}), \
+                    mock.patch('projector_installer.utils.is_inside_docker', return_value=False):
+                self.assertEqual(read_local_addresses(), ('127.0.0.1', '10.0.0.5'))
+        finally:
+            read_local_addresses.cache_clear()